@@ -0,0 +1,152 @@
+"""
+bulkTypeConversion.py
+
+A concise, educational guide to converting whole columns of strings at once.
+Section 8 of 1dataTypes.py converts one value at a time (isdigit() then int()).
+This script converts a sequence of strings into a typed array plus a validity
+mask, handling signs, whitespace and float truncation, and shows how to do the
+same chunk by chunk over a stream.
+"""
+
+import math
+import re
+from array import array
+from itertools import islice
+
+# ---------------------------------------------------------------------
+# Why isdigit() Is Not Enough
+# ---------------------------------------------------------------------
+# isdigit() rejects signs, whitespace and decimals, even though int()/float()
+# could convert some of them.
+
+for text in ["30", "-5", " 7 ", "5.9"]:
+    print(f"{text!r:>7}: isdigit() = {text.isdigit()}")
+print()
+
+# ---------------------------------------------------------------------
+# Validating with Precompiled Patterns
+# ---------------------------------------------------------------------
+# A compiled regular expression checks each value without raising and catching
+# an exception for every bad entry.
+
+INT_PATTERN = re.compile(r"\s*[+-]?\d+\s*")
+FLOAT_PATTERN = re.compile(r"\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*")
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def convert_column(values, dtype="int64", truncate=True):
+    """Convert a sequence of strings to a typed array plus a validity mask.
+
+    dtype is "int64" or "float64". For int64, float strings such as "5.9" are
+    truncated toward zero like int(5.9) when truncate is True, and marked
+    invalid otherwise. Invalid entries hold 0 in the array and 0 in the mask.
+    """
+    if dtype not in ("int64", "float64"):
+        raise ValueError(f"Unsupported dtype: {dtype!r} (use 'int64' or 'float64')")
+
+    result = array("q" if dtype == "int64" else "d")
+    mask = bytearray()
+    int_match = INT_PATTERN.fullmatch
+    float_match = FLOAT_PATTERN.fullmatch
+
+    for text in values:
+        value = None
+        if dtype == "float64":
+            if float_match(text):
+                value = float(text)
+        elif int_match(text):
+            value = int(text)
+        elif truncate and float_match(text):
+            number = float(text)
+            if math.isfinite(number):  # "1e400" parses to inf, which int() rejects
+                value = int(number)
+        if dtype == "int64" and value is not None and not INT64_MIN <= value <= INT64_MAX:
+            value = None  # out of int64 range
+
+        result.append(0 if value is None else value)
+        mask.append(value is not None)
+    return result, mask
+
+
+column = ["30", "-5", " +7 ", "5.9", "-2.7", "abc", "", "1e3"]
+ints, valid = convert_column(column)
+print("Input column:", column)
+print("int64 values:", ints.tolist())
+print("Valid mask:  ", list(valid))
+
+floats, valid_floats = convert_column(column, dtype="float64")
+print("float64 values:", floats.tolist())
+print("Valid mask:    ", list(valid_floats))
+
+strict, strict_valid = convert_column(column, truncate=False)
+print("int64 without truncation, mask:", list(strict_valid))
+print()
+
+# ---------------------------------------------------------------------
+# Edge Cases
+# ---------------------------------------------------------------------
+# Values outside the int64 range are marked invalid instead of overflowing.
+
+big, big_valid = convert_column(["9223372036854775807", "9223372036854775808", "1e400"])
+print("int64 limits:", big.tolist(), list(big_valid))
+
+try:
+    convert_column(["1"], dtype="int8")
+except ValueError as e:
+    print("ValueError:", e)
+print()
+
+# ---------------------------------------------------------------------
+# Streaming: Converting Chunk by Chunk
+# ---------------------------------------------------------------------
+# For inputs too large to hold at once, pull a fixed number of strings from any
+# iterable (a file, a generator) and convert each chunk separately.
+
+
+def convert_stream(values, chunk_size=10_000, dtype="int64", truncate=True):
+    """Yield (array, mask) pairs for consecutive chunks of an iterable of strings."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield convert_column(chunk, dtype=dtype, truncate=truncate)
+
+
+lines = (f" {n} " if n % 4 else "n/a" for n in range(10))
+total = 0
+invalid = 0
+for chunk_values, chunk_mask in convert_stream(lines, chunk_size=4):
+    print("Chunk:", chunk_values.tolist(), "| mask:", list(chunk_mask))
+    total += sum(chunk_values)
+    invalid += chunk_mask.count(0)
+print(f"Streamed total: {total} | Invalid entries: {invalid}")
+print()
+
+# ---------------------------------------------------------------------
+# Summary: Variable Types
+# ---------------------------------------------------------------------
+variables = {
+    "column": type(column),
+    "ints": type(ints),
+    "valid": type(valid),
+    "floats": type(floats),
+}
+print("Variable types summary:")
+for var, typ in variables.items():
+    print(f"{var}: {typ.__name__}")
+
+# ---------------------------------------------------------------------
+# Key Takeaways
+# ---------------------------------------------------------------------
+print("""
+Key Takeaways:
+- isdigit() rejects signs, spaces and decimals that int()/float() accept.
+- Precompiled patterns validate values without one exception per bad entry.
+- A typed array plus a validity mask keeps bad rows without losing positions.
+- Convert large inputs chunk by chunk to keep memory bounded.
+""")
@@ -0,0 +1,182 @@
+"""
+batchInputOutput.py
+
+A concise, educational guide to fast, non-interactive input and output.
+2inputOutput.py reads one line at a time with input() and prints each result.
+That is fine for a person typing, but slow for millions of piped lines. This
+script reads sys.stdin.buffer in large blocks, parses whole blocks of ints or
+floats at once, reports errors per line, and writes results through one
+buffered writer.
+
+Run it as a lesson:
+    python 1Basics/5batchInputOutput.py
+Or as a filter over piped data (one value per line):
+    python 1Basics/5batchInputOutput.py int < numbers.txt
+    python 1Basics/5batchInputOutput.py float < numbers.txt
+"""
+
+import io
+import os
+import sys
+import time
+
+# ---------------------------------------------------------------------
+# Reading Input in Blocks
+# ---------------------------------------------------------------------
+# Reading 1 MiB at a time makes one system call per block instead of one per
+# line. A block usually ends mid-line, so the partial last line is carried
+# over and completed by the next block.
+
+BLOCK_SIZE = 1 << 20  # 1 MiB
+
+
+def read_line_blocks(stream, block_size=BLOCK_SIZE):
+    """Yield lists of complete lines (bytes, without newlines) from a binary stream."""
+    remainder = b""
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+        lines = (remainder + block).split(b"\n")
+        remainder = lines.pop()  # incomplete last line (or b"" after a final newline)
+        if lines:
+            yield lines
+    if remainder:
+        yield [remainder]
+
+
+# ---------------------------------------------------------------------
+# Parsing a Whole Block at Once
+# ---------------------------------------------------------------------
+# int() and float() accept bytes and ignore surrounding whitespace (including
+# a trailing '\r'). list(map(int, lines)) converts a whole block in C; only if
+# that fails do we fall back to line-by-line parsing to find the bad lines.
+
+
+def parse_block(lines, convert):
+    """Return a list of converted values, with None for each invalid line."""
+    try:
+        return list(map(convert, lines))
+    except ValueError:
+        values = []
+        for line in lines:
+            try:
+                values.append(convert(line))
+            except ValueError:
+                values.append(None)
+        return values
+
+
+# ---------------------------------------------------------------------
+# Batch Mode with the Same Messages as 2inputOutput.py
+# ---------------------------------------------------------------------
+# int mode mirrors the "Enter a number" prompt; float mode mirrors the
+# "Enter a floating-point number" prompt. Invalid lines get the same message
+# plus their line number. Everything goes to one buffered writer.
+
+MODES = {
+    "int": (int, lambda n: f"Square of {n} is {n ** 2}",
+            "Invalid input! Please enter a valid integer."),
+    "float": (float, lambda x: f"You entered: {x}",
+              "Please enter a valid floating-point number."),
+}
+
+
+def run_batch(mode, stdin, stdout, block_size=BLOCK_SIZE):
+    """Process every line of stdin; return (valid, invalid) line counts."""
+    convert, describe, error_message = MODES[mode]
+    valid = invalid = 0
+    line_number = 0
+    for lines in read_line_blocks(stdin, block_size):
+        output = []
+        for value in parse_block(lines, convert):
+            line_number += 1
+            if value is None:
+                invalid += 1
+                output.append(f"line {line_number}: {error_message}")
+            else:
+                valid += 1
+                output.append(describe(value))
+        output.append("")  # trailing newline for the block
+        stdout.write("\n".join(output).encode())
+    stdout.flush()
+    return valid, invalid
+
+
+# ---------------------------------------------------------------------
+# Lesson: Examples, Edge Cases and a Benchmark
+# ---------------------------------------------------------------------
+
+
+def lesson():
+    print("Batch mode over in-memory input (int):")
+    sample = io.BytesIO(b"7\n-3\n  12 \nabc\n\n5")  # no final newline on purpose
+    output = io.BytesIO()
+    valid, invalid = run_batch("int", sample, output)
+    print(output.getvalue().decode(), end="")
+    print(f"Valid lines: {valid} | Invalid lines: {invalid}")
+    print()
+
+    print("Batch mode over in-memory input (float), tiny blocks to show line carry-over:")
+    sample = io.BytesIO(b"3.5\n1e3\nnot a float\n-0.25\r\n")
+    output = io.BytesIO()
+    run_batch("float", sample, output, block_size=4)
+    print(output.getvalue().decode(), end="")
+    print()
+
+    # Benchmark: per-line input()/print() vs block reads and one buffered writer.
+    lines = 500_000
+    data = b"".join(b"%d\n" % n for n in range(lines))
+
+    def per_line():
+        # Restore whatever streams were active before (a caller may have redirected them).
+        saved_stdin, saved_stdout = sys.stdin, sys.stdout
+        sys.stdin = io.TextIOWrapper(io.BytesIO(data))
+        sys.stdout = open(os.devnull, "w")
+        try:
+            for _ in range(lines):
+                num = int(input())
+                print(f"Square of {num} is {num ** 2}")
+        finally:
+            sys.stdout.close()
+            sys.stdin, sys.stdout = saved_stdin, saved_stdout
+
+    def batched():
+        with open(os.devnull, "wb") as sink:
+            run_batch("int", io.BytesIO(data), sink)
+
+    print(f"Benchmark ({lines:,} lines, int mode):")
+    for label, run in [("input()/print() per line", per_line), ("block read + bulk parse", batched)]:
+        start = time.perf_counter()
+        run()
+        print(f"  {label:<26} {(time.perf_counter() - start) * 1000:8.1f} ms")
+    print()
+
+    # Summary: Variable Types
+    variables = {
+        "sample": type(sample),
+        "output": type(output),
+        "data": type(data),
+        "valid": type(valid),
+    }
+    print("Variable types summary:")
+    for var, typ in variables.items():
+        print(f"{var}: {typ.__name__}")
+
+    print("""
+Key Takeaways:
+- input() and print() per line are convenient but slow for piped data.
+- Read sys.stdin.buffer in large blocks and carry partial lines over.
+- Convert a whole block with map(); fall back per line only on errors.
+- Collect output and write it through one buffered writer.
+""")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        if sys.argv[1] not in MODES:
+            sys.exit(f"usage: {sys.argv[0]} [int|float] < input.txt")
+        valid, invalid = run_batch(sys.argv[1], sys.stdin.buffer, sys.stdout.buffer)
+        print(f"{valid} valid lines, {invalid} invalid lines", file=sys.stderr)
+    else:
+        lesson()
@@ -0,0 +1,246 @@
+"""
+Python Array Operators Guide
+
+3operators.py applies +, -, *, /, //, %, ** and the comparisons to single
+numbers. This script applies the same operators element-wise to whole arrays
+of numbers (array.array), including:
+- Arithmetic kernels that return a new typed array
+- Comparison kernels that return a 0/1 mask
+- Division and modulo by zero reported through a validity mask instead of
+  raising ZeroDivisionError for the whole operation
+- A benchmark against plain Python loops
+
+Run this script to see outputs and learn how element-wise operations work.
+"""
+
+import operator
+import time
+from array import array
+from itertools import repeat
+
+# ---------------------------------------------------------------------
+# Element-wise Kernels
+# A kernel pairs up items from two arrays (or an array and a single number)
+# and applies one operator to each pair. map() with the functions from the
+# operator module does the looping in C.
+
+
+def _pairs(a, b):
+    """Return two iterables of equal length and that length; a single number is repeated."""
+    if isinstance(b, (int, float)):
+        return a, repeat(b, len(a)), len(a)
+    if isinstance(a, (int, float)):
+        return repeat(a, len(b)), b, len(b)
+    if len(a) != len(b):
+        raise ValueError(f"length mismatch: {len(a)} vs {len(b)}")
+    return a, b, len(a)
+
+
+def _typecode(a, b):
+    """Integer result ('q') only if both operands are integers."""
+    for operand in (a, b):
+        if isinstance(operand, float) or getattr(operand, "typecode", "q") == "d":
+            return "d"
+    return "q"
+
+
+def _arithmetic(op):
+    def kernel(a, b):
+        left, right, _ = _pairs(a, b)
+        return array(_typecode(a, b), map(op, left, right))
+    kernel.__name__ = op.__name__
+    return kernel
+
+
+add = _arithmetic(operator.add)
+sub = _arithmetic(operator.sub)
+mul = _arithmetic(operator.mul)
+
+
+def power(a, b):
+    """a ** b element-wise; a negative integer exponent gives a float ('d') array, like 2 ** -1."""
+    left, right, _ = _pairs(a, b)
+    typecode = _typecode(a, b)
+    if typecode == "q":
+        exponents = [b] if isinstance(b, int) else b
+        if len(exponents) and min(exponents) < 0:
+            typecode = "d"
+    return array(typecode, map(operator.pow, left, right))
+
+
+def _comparison(op):
+    def kernel(a, b):
+        left, right, _ = _pairs(a, b)
+        return bytearray(map(op, left, right))  # True/False become 1/0
+    kernel.__name__ = op.__name__
+    return kernel
+
+
+eq = _comparison(operator.eq)
+ne = _comparison(operator.ne)
+lt = _comparison(operator.lt)
+le = _comparison(operator.le)
+gt = _comparison(operator.gt)
+ge = _comparison(operator.ge)
+
+
+# ---------------------------------------------------------------------
+# Division by Zero: Masks Instead of Exceptions
+# With scalars, a / 0 raises. With arrays, one zero should not throw away the
+# other results. The kernels return (result, valid) where valid[i] is 0 for a
+# division by zero; the result holds a sentinel there (nan for floats, 0 for
+# ints). If there are no zeros at all, the fast map() path is used.
+
+def _division(op, result_typecode=None):
+    def kernel(a, b):
+        left, right, length = _pairs(a, b)
+        typecode = result_typecode or _typecode(a, b)
+        sentinel = float("nan") if typecode == "d" else 0
+        if isinstance(b, (int, float)):
+            if b == 0:
+                return array(typecode, [sentinel]) * length, bytearray(length)
+            return array(typecode, map(op, left, right)), bytearray(b"\x01") * length
+
+        valid = bytearray(map(bool, right))  # 0 wherever the divisor is zero
+        if valid.count(0) == 0:
+            return array(typecode, map(op, left, right)), valid
+        # Divide by 1 where the divisor is zero, then swap in the sentinel there.
+        safe_right = [y or 1 for y in right]
+        quotients = map(op, left, safe_right)
+        return array(typecode, [q if ok else sentinel for q, ok in zip(quotients, valid)]), valid
+    kernel.__name__ = op.__name__
+    return kernel
+
+
+truediv = _division(operator.truediv, result_typecode="d")
+floordiv = _division(operator.floordiv)
+mod = _division(operator.mod)
+
+
+# ---------------------------------------------------------------------
+# Arithmetic Operators on Arrays
+
+print("Arithmetic Operators (element-wise):")
+a = array("q", [10, 7, -9, 4])
+b = array("q", [3, 2, 4, 0])
+print("a =", a.tolist())
+print("b =", b.tolist())
+
+print("a + b =", add(a, b).tolist())
+print("a - b =", sub(a, b).tolist())
+print("a * b =", mul(a, b).tolist())
+print("a ** 2 =", power(a, 2).tolist())
+
+quotient, valid = truediv(a, b)
+print("a / b =", quotient.tolist(), "| valid:", list(valid))
+floor_quotient, valid = floordiv(a, b)
+print("a // b =", floor_quotient.tolist(), "| valid:", list(valid))
+remainder, valid = mod(a, b)
+print("a % b =", remainder.tolist(), "| valid:", list(valid))
+
+# Edge case: floor division and modulo round toward negative infinity, like scalars
+print("-9 // 4 =", -9 // 4, "| -9 % 4 =", -9 % 4)
+
+# Edge case: int and float arrays mix into a float result
+prices = array("d", [1.5, 2.25, 3.0, 4.75])
+print("a + prices =", add(a, prices).tolist())
+print()
+
+# ---------------------------------------------------------------------
+# Comparison Operators on Arrays
+# Results are masks: 1 where the comparison is True, 0 where it is False.
+
+print("Comparison Operators (element-wise):")
+print("a == b:", list(eq(a, b)))
+print("a != b:", list(ne(a, b)))
+print("a > b:", list(gt(a, b)))
+print("a < b:", list(lt(a, b)))
+print("a >= 4:", list(ge(a, 4)))
+print("a <= 4:", list(le(a, 4)))
+
+# Masks can select items
+selected = [x for x, keep in zip(a, gt(a, b)) if keep]
+print("Items where a > b:", selected)
+print()
+
+# ---------------------------------------------------------------------
+# Edge Cases and Best Practices
+
+# Edge case: arrays must have the same length
+try:
+    add(a, array("q", [1, 2]))
+except ValueError as e:
+    print("ValueError:", e)
+
+# Edge case: int64 results that don't fit raise OverflowError
+try:
+    power(array("q", [10]), 19)
+except OverflowError as e:
+    print("OverflowError:", e)
+
+# Edge case: negative integer exponents give floats, as with scalars (2 ** -1 == 0.5)
+print("a ** -1 =", power(a, -1).tolist(), "| typecode:", power(a, -1).typecode)
+
+# Edge case: dividing by a scalar zero marks every item invalid
+_, valid = truediv(a, 0)
+print("a / 0 valid mask:", list(valid))
+print()
+
+# ---------------------------------------------------------------------
+# Benchmark: Kernels vs Plain Python Loops
+
+N = 1_000_000
+left = array("q", range(1, N + 1))
+right = array("q", [(i % 7) for i in range(N)])  # contains zeros
+
+
+def python_loop_add():
+    result = []
+    for i in range(N):
+        result.append(left[i] + right[i])
+    return result
+
+
+def python_loop_div():
+    result = []
+    for i in range(N):
+        try:
+            result.append(left[i] / right[i])
+        except ZeroDivisionError:
+            result.append(float("nan"))
+    return result
+
+
+benchmarks = [
+    ("a + b  (Python loop)", python_loop_add),
+    ("a + b  (kernel)", lambda: add(left, right)),
+    ("a > b  (kernel)", lambda: gt(left, right)),
+    ("a / b  (Python loop + try)", python_loop_div),
+    ("a / b  (kernel with zeros)", lambda: truediv(left, right)),
+    ("a / b  (kernel, no zeros)", lambda: truediv(left, left)),
+]
+print(f"Benchmark ({N:,} elements):")
+for label, run in benchmarks:
+    start = time.perf_counter()
+    run()
+    print(f"  {label:<28} {(time.perf_counter() - start) * 1000:8.1f} ms")
+print()
+
+# ---------------------------------------------------------------------
+# Summary: Variable Types
+
+variables = {
+    "a": type(a),
+    "prices": type(prices),
+    "quotient": type(quotient),
+    "valid": type(valid),
+}
+print("Variable types summary:")
+for name, typ in variables.items():
+    print(f"{name}: {typ.__name__}")
+
+print("\nKey Takeaways:")
+print("- Element-wise kernels apply one operator across whole arrays.")
+print("- map() with operator functions moves the loop into C.")
+print("- Comparisons produce 0/1 masks that can select items.")
+print("- Division by zero is reported per element with a validity mask.")
@@ -0,0 +1,224 @@
+"""
+Python Bitsets Guide
+
+The bitwise section of 3operators.py uses &, |, ^, ~, << and >> on small ints.
+The same operators work as set operations when each bit is a flag: bit i is 1
+if item i is in the set. This script introduces a packed Bitset class backed
+by a bytearray (one bit per item), with:
+- Bulk and/or/xor/not and shifts
+- Popcount (number of set bits)
+- Iteration over set bits and fast membership tests
+- A benchmark against Python big ints and sets of ints
+
+Run this script to see outputs and learn how bitsets work.
+"""
+
+import sys
+import time
+
+# ---------------------------------------------------------------------
+# Bits as Flags
+# Each bit of an int can stand for "item i is present".
+
+m = 0b1010  # items 1 and 3
+k = 0b0110  # items 1 and 2
+print("Bits as Flags:")
+print("m & k:", bin(m & k), "-> items in both")
+print("m | k:", bin(m | k), "-> items in either")
+print("m ^ k:", bin(m ^ k), "-> items in exactly one")
+print()
+
+# ---------------------------------------------------------------------
+# A Packed Bitset
+# Bit i lives in byte i // 8 at position i % 8. Whole-set operations convert
+# the buffer to one big int (int.from_bytes runs in C), apply a single
+# operator, and convert back, so no Python loop touches individual bits.
+
+# For each byte value, the positions of its set bits (used for iteration).
+_BIT_POSITIONS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+class Bitset:
+    """Fixed-size set of integers in range(size), stored one bit per item."""
+
+    def __init__(self, size, items=()):
+        if size < 0:
+            raise ValueError("size must be non-negative")
+        self.size = size
+        self._bytes = bytearray((size + 7) // 8)
+        for item in items:
+            self.add(item)
+
+    @classmethod
+    def _from_int(cls, size, value):
+        bitset = cls(size)
+        value &= (1 << size) - 1  # drop bits shifted or inverted past the end
+        bitset._bytes[:] = value.to_bytes(len(bitset._bytes), "little")
+        return bitset
+
+    def _to_int(self):
+        return int.from_bytes(self._bytes, "little")
+
+    def _check(self, item):
+        if not 0 <= item < self.size:
+            raise IndexError(f"item {item} out of range for Bitset of size {self.size}")
+
+    def add(self, item):
+        self._check(item)
+        self._bytes[item >> 3] |= 1 << (item & 7)
+
+    def discard(self, item):
+        self._check(item)
+        self._bytes[item >> 3] &= ~(1 << (item & 7)) & 0xFF
+
+    def __contains__(self, item):
+        return 0 <= item < self.size and bool(self._bytes[item >> 3] >> (item & 7) & 1)
+
+    def _same_size(self, other):
+        if not isinstance(other, Bitset) or other.size != self.size:
+            raise ValueError("bitsets must have the same size")
+
+    def __and__(self, other):
+        self._same_size(other)
+        return Bitset._from_int(self.size, self._to_int() & other._to_int())
+
+    def __or__(self, other):
+        self._same_size(other)
+        return Bitset._from_int(self.size, self._to_int() | other._to_int())
+
+    def __xor__(self, other):
+        self._same_size(other)
+        return Bitset._from_int(self.size, self._to_int() ^ other._to_int())
+
+    def __invert__(self):
+        return Bitset._from_int(self.size, ~self._to_int())
+
+    def __lshift__(self, n):
+        return Bitset._from_int(self.size, self._to_int() << n)
+
+    def __rshift__(self, n):
+        return Bitset._from_int(self.size, self._to_int() >> n)
+
+    def count(self):
+        """Number of items in the set (popcount)."""
+        return self._to_int().bit_count()
+
+    __len__ = count
+
+    def __iter__(self):
+        # Skip empty bytes quickly; look up bit positions for the rest.
+        for index, value in enumerate(self._bytes):
+            if value:
+                base = index << 3
+                for bit in _BIT_POSITIONS[value]:
+                    yield base + bit
+
+    def __eq__(self, other):
+        return isinstance(other, Bitset) and self.size == other.size and self._bytes == other._bytes
+
+    def __repr__(self):
+        return f"Bitset({self.size}, {list(self)})"
+
+
+# ---------------------------------------------------------------------
+# Bitwise Operators on Bitsets
+
+print("Bitset Operators:")
+a = Bitset(16, [1, 3, 5, 8])
+b = Bitset(16, [1, 2, 8, 15])
+print("a:", a)
+print("b:", b)
+print("a & b:", list(a & b))
+print("a | b:", list(a | b))
+print("a ^ b:", list(a ^ b))
+print("~a:", list(~a))
+print("a << 1:", list(a << 1))
+print("a >> 1:", list(a >> 1))
+print("Popcount of a:", a.count())
+print("Is 5 in a?", 5 in a, "| Is 6 in a?", 6 in a)
+print()
+
+# ---------------------------------------------------------------------
+# Edge Cases and Best Practices
+
+# Edge case: bits shifted past the end are dropped, like a fixed-width register
+print("Bitset(16, [15]) << 1:", list(Bitset(16, [15]) << 1))
+
+# Edge case: ~ only flips bits inside the set's size (Python's ~ on ints gives negatives)
+print("~0 for a Python int:", ~0, "| ~Bitset(4):", list(~Bitset(4)))
+
+# Edge case: items outside the range
+try:
+    a.add(16)
+except IndexError as e:
+    print("IndexError:", e)
+
+# Edge case: different sizes can't be combined
+try:
+    a & Bitset(8)
+except ValueError as e:
+    print("ValueError:", e)
+print()
+
+# ---------------------------------------------------------------------
+# Benchmark: Bitset vs Big Int vs Set of Ints
+# Python ints already act as bitsets; the Bitset adds a fixed size, a mutable
+# buffer and fast single-bit updates (a big int is rebuilt on every change).
+
+SIZE = 10_000_000
+STEP = 10  # every 10th item is in the first set, every 15th in the second
+first_items = range(0, SIZE, STEP)
+second_items = range(0, SIZE, 15)
+
+first_bitset, second_bitset = Bitset(SIZE, first_items), Bitset(SIZE, second_items)
+first_int = first_bitset._to_int()
+second_int = second_bitset._to_int()
+first_set, second_set = set(first_items), set(second_items)
+
+print(f"Benchmark ({SIZE:,} possible items, {len(first_set):,} and {len(second_set):,} present):")
+print(f"  Memory - Bitset: {sys.getsizeof(first_bitset._bytes):,} B | "
+      f"big int: {sys.getsizeof(first_int):,} B | "
+      f"set: {sys.getsizeof(first_set) + len(first_set) * 28:,} B (approx., incl. int objects)")
+
+benchmarks = [
+    ("a & b", lambda: first_bitset & second_bitset, lambda: first_int & second_int, lambda: first_set & second_set),
+    ("a | b", lambda: first_bitset | second_bitset, lambda: first_int | second_int, lambda: first_set | second_set),
+    ("popcount", first_bitset.count, first_int.bit_count, first_set.__len__),
+    # Testing one bit of a big int shifts the whole number, so each test is O(size).
+    ("1k membership tests",
+     lambda: [i in first_bitset for i in range(0, SIZE, SIZE // 1000)],
+     lambda: [first_int >> i & 1 for i in range(0, SIZE, SIZE // 1000)],
+     lambda: [i in first_set for i in range(0, SIZE, SIZE // 1000)]),
+    ("iterate set bits", lambda: sum(first_bitset), None, lambda: sum(first_set)),
+]
+for label, *runs in benchmarks:
+    timings = []
+    for run in runs:
+        if run is None:
+            timings.append("       n/a")
+            continue
+        start = time.perf_counter()
+        run()
+        timings.append(f"{(time.perf_counter() - start) * 1000:7.2f} ms")
+    print(f"  {label:<22} Bitset: {timings[0]} | big int: {timings[1]} | set: {timings[2]}")
+print()
+
+# ---------------------------------------------------------------------
+# Summary: Variable Types
+
+variables = {
+    "m": type(m),
+    "a": type(a),
+    "first_int": type(first_int),
+    "first_set": type(first_set),
+}
+print("Variable types summary:")
+for name, typ in variables.items():
+    print(f"{name}: {typ.__name__}")
+
+print("\nKey Takeaways:")
+print("- A bitset stores one bit per possible item: 8 items per byte.")
+print("- &, |, ^ and ~ on bitsets are intersection, union, symmetric difference and complement.")
+print("- Converting the buffer to one big int applies an operator to all bits in C.")
+print("- int.bit_count() counts set bits without looping in Python.")
+print("- Sets of ints are faster to iterate when few items are present, but use far more memory.")
@@ -0,0 +1,189 @@
+"""
+Decision Tables: A Concise Educational Guide
+
+This script shows how an ordered if/elif/else threshold chain, like the
+grading chain in 1ifElifElse.py, can be compiled into a lookup table.
+It covers:
+- Turning 'score >= 90 / >= 80 / >= 70 / else' into sorted thresholds
+- Looking up one score with bisect (O(log n) instead of one test per branch)
+- Grading many scores at once
+- A randomized property check that the table matches the if/elif chain
+- A benchmark of both against the interpreted chain
+"""
+
+import random
+import time
+from bisect import bisect_right
+from functools import partial
+from itertools import compress
+from operator import ne
+
+# ---------------------------------------------------------------------
+# Section 1: The Interpreted Chain
+# Each score is tested against the branches in order until one matches.
+
+
+def grade_chain(score):
+    if score >= 90:
+        return "A"
+    elif score >= 80:
+        return "B"
+    elif score >= 70:
+        return "C"
+    else:
+        return "D or below"
+
+
+print("Section 1: The Interpreted Chain")
+print("grade_chain(85):", grade_chain(85))  # Output: B
+print()
+
+# ---------------------------------------------------------------------
+# Section 2: Compiling the Chain into a Table
+# An ordered '>=' chain is described by (threshold, label) rules plus a
+# default. Sorting the thresholds lets bisect_right count how many of them
+# a score reaches; that count picks the label.
+#
+#   thresholds: [70,  80,  90]
+#   labels:     [D, C,   B,   A]   (index = number of thresholds reached)
+#
+# A rule that can never fire (its threshold is not below every earlier
+# threshold, so an earlier branch always catches it first) is dropped, just
+# like an unreachable 'elif'.
+
+
+class RuleTable:
+    """Compiled form of an ordered 'if value >= threshold' chain."""
+
+    def __init__(self, rules, default):
+        reachable = []
+        lowest_so_far = float("inf")
+        for threshold, label in rules:
+            if threshold < lowest_so_far:
+                reachable.append((threshold, label))
+                lowest_so_far = threshold
+        reachable.reverse()  # ascending thresholds
+        self.thresholds = [threshold for threshold, _ in reachable]
+        self.labels = [default] + [label for _, label in reachable]
+        self.default = default
+        self._lookup = partial(bisect_right, self.thresholds)
+
+    def __call__(self, value):
+        if value != value:  # NaN fails every '>=' test in the chain
+            return self.default
+        return self.labels[bisect_right(self.thresholds, value)]
+
+    def many(self, values):
+        """Labels for a whole iterable of values, looked up in bulk."""
+        values = list(values)  # read twice below, so a generator must be materialized
+        indices = list(map(self._lookup, values))  # bisect runs in C for every value
+        # value != value is only true for NaN (and works for huge ints, unlike isnan)
+        for position in compress(range(len(indices)), map(ne, values, values)):
+            indices[position] = 0  # NaN -> default, as in the chain
+        return list(map(self.labels.__getitem__, indices))
+
+
+grade_table = RuleTable([(90, "A"), (80, "B"), (70, "C")], default="D or below")
+
+print("Section 2: Compiling the Chain into a Table")
+print("Thresholds:", grade_table.thresholds)
+print("Labels:", grade_table.labels)
+print("grade_table(85):", grade_table(85))  # Output: B
+print("grade_table.many([95, 70, 69.9, 80]):", grade_table.many([95, 70, 69.9, 80]))
+print("many() over a generator with NaN:", grade_table.many(x for x in [95, float("nan"), 10 ** 400]))
+
+# Edge case: boundaries belong to the higher grade, exactly like '>='
+print("Boundary 90 ->", grade_table(90), "| 89.999 ->", grade_table(89.999))
+
+# Edge case: an unreachable rule is dropped ('>= 85' after '>= 80' can never fire)
+odd_chain = RuleTable([(80, "pass"), (85, "never"), (50, "retake")], default="fail")
+print("Unreachable rule dropped, labels:", odd_chain.labels)
+print()
+
+# ---------------------------------------------------------------------
+# Section 3: Property Check - The Table Always Matches the Chain
+# Random chains (any order, duplicate thresholds) and random scores
+# (ints, floats, boundaries, NaN, infinities) are compared one by one.
+
+
+def run_chain(rules, default, value):
+    """Evaluate rules exactly like an if/elif/else chain would."""
+    for threshold, label in rules:
+        if value >= threshold:
+            return label
+    return default
+
+
+def check_property(trials=300, seed=1234):
+    rng = random.Random(seed)
+    checked = 0
+    for _ in range(trials):
+        rules = [(rng.choice([rng.randint(-5, 105), rng.uniform(-5, 105)]), f"L{i}")
+                 for i in range(rng.randint(0, 6))]
+        table = RuleTable(rules, default="default")
+        values = [rng.randint(-10, 110) for _ in range(20)]
+        values += [rng.uniform(-10, 110) for _ in range(20)]
+        values += [threshold for threshold, _ in rules]  # exact boundaries
+        values += [float("nan"), float("inf"), float("-inf")]
+        expected = [run_chain(rules, "default", v) for v in values]
+        assert [table(v) for v in values] == expected, (rules, values)
+        assert table.many(values) == expected, (rules, values)
+        checked += len(values)
+    return checked
+
+
+print("Section 3: Property Check")
+print(f"Table matched the chain on {check_property():,} random cases.")
+print()
+
+# ---------------------------------------------------------------------
+# Section 4: Benchmark
+
+N = 1_000_000
+scores = [random.uniform(0, 100) for _ in range(N)]
+
+print(f"Section 4: Benchmark ({N:,} scores)")
+start = time.perf_counter()
+chain_labels = [grade_chain(s) for s in scores]
+print(f"  if/elif chain:         {(time.perf_counter() - start) * 1000:8.1f} ms")
+start = time.perf_counter()
+scalar_labels = [grade_table(s) for s in scores]
+print(f"  table, one at a time:  {(time.perf_counter() - start) * 1000:8.1f} ms")
+start = time.perf_counter()
+bulk_labels = grade_table.many(scores)
+print(f"  table, in bulk:        {(time.perf_counter() - start) * 1000:8.1f} ms")
+print("  Same labels:", chain_labels == scalar_labels == bulk_labels)
+
+# With many branches the chain does many comparisons per score; bisect only ~log2(n).
+percentile_rules = [(100 - p, f"P{100 - p}") for p in range(1, 100)]
+percentile_table = RuleTable(percentile_rules, default="P0")
+sample = scores[:100_000]
+start = time.perf_counter()
+chain_labels = [run_chain(percentile_rules, "P0", s) for s in sample]
+print(f"  99-branch chain ({len(sample):,} scores): {(time.perf_counter() - start) * 1000:8.1f} ms")
+start = time.perf_counter()
+bulk_labels = percentile_table.many(sample)
+print(f"  99-branch table ({len(sample):,} scores): {(time.perf_counter() - start) * 1000:8.1f} ms")
+print("  Same labels:", chain_labels == bulk_labels)
+print()
+
+# ---------------------------------------------------------------------
+# Section 5: Summary and Key Takeaways
+
+print("Section 5: Summary and Key Takeaways")
+variables = {
+    "grade_table": type(grade_table).__name__,
+    "thresholds": type(grade_table.thresholds).__name__,
+    "labels": type(grade_table.labels).__name__,
+    "scores": type(scores).__name__,
+}
+print("Variable types:", variables)
+
+print("""
+Key Takeaways:
+- An ordered '>=' chain is a sorted list of thresholds plus labels.
+- bisect finds the matching branch in O(log n) comparisons.
+- With three branches the chain is already fast; the table wins as branches grow.
+- map() with bisect grades a whole batch without a Python-level loop body.
+- Check edge cases (boundaries, NaN, unreachable branches) against the original chain.
+""")
@@ -0,0 +1,200 @@
+"""
+Batched Rule Evaluation: A Concise Educational Guide
+
+This script takes the nested access check from 1ifElifElse.py
+
+    if age >= 18:
+        if has_id: "Access granted"
+        else:      "ID required"
+    else:          "Access denied"
+
+and evaluates it for whole columns of records at once. It covers:
+- Building 0/1 masks for each condition in one pass per column
+- Combining masks into outcome codes with a byte translation table
+- A small categorical result type (codes + category names)
+- Per-branch hit counts, to decide which branch to test first
+- A benchmark against the per-record nested if
+"""
+
+import operator
+import random
+import sys
+import time
+from itertools import repeat
+
+# ---------------------------------------------------------------------
+# Section 1: The Per-Record Nested Conditional
+
+
+def check_access(age, has_id):
+    if age >= 18:
+        if has_id:
+            return "Access granted"
+        else:
+            return "ID required"
+    else:
+        return "Access denied"
+
+
+print("Section 1: The Per-Record Nested Conditional")
+print("check_access(20, True):", check_access(20, True))    # Output: Access granted
+print("check_access(20, False):", check_access(20, False))  # Output: ID required
+print("check_access(15, True):", check_access(15, True))    # Output: Access denied
+print()
+
+# ---------------------------------------------------------------------
+# Section 2: A Categorical Result
+# Storing one small code per record (in a bytearray) is much cheaper than
+# storing a string per record. The category names are kept once.
+
+
+class Categorical:
+    """Sequence of category names stored as one byte-sized code per item."""
+
+    def __init__(self, codes, categories):
+        self.codes = codes
+        self.categories = list(categories)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, position):
+        return self.categories[self.codes[position]]
+
+    def __iter__(self):
+        return map(self.categories.__getitem__, self.codes)
+
+    def value_counts(self):
+        """How many items fall in each category (bytearray.count runs in C)."""
+        return {name: self.codes.count(code) for code, name in enumerate(self.categories)}
+
+    def __repr__(self):
+        preview = list(map(self.categories.__getitem__, self.codes[:5]))
+        more = ", ..." if len(self.codes) > 5 else ""
+        return f"Categorical({preview}{more}, length={len(self)})"
+
+
+# ---------------------------------------------------------------------
+# Section 3: Evaluating the Rule with Masks
+# 1. adult = (age >= 18) for every record -> a 0/1 bytearray
+# 2. key = adult * 2 + has_id            -> 0, 1, 2 or 3 per record
+# 3. translate each key to an outcome code with a 256-byte lookup table
+# Step 2 reads each 0/1 mask as one big int (as in 1Basics/7bitsets.py):
+# doubling and adding never carries between bytes, because every byte of
+# the sum is at most 3. Every step is one C-level pass over a column; no
+# Python if runs per record.
+
+OUTCOMES = ["Access granted", "ID required", "Access denied"]
+GRANTED, ID_REQUIRED, DENIED = range(3)
+
+# key (adult * 2 + has_id) -> outcome code
+_KEY_TO_OUTCOME = bytearray(256)
+_KEY_TO_OUTCOME[0] = DENIED       # minor, no ID
+_KEY_TO_OUTCOME[1] = DENIED       # minor, with ID
+_KEY_TO_OUTCOME[2] = ID_REQUIRED  # adult, no ID
+_KEY_TO_OUTCOME[3] = GRANTED      # adult, with ID
+_KEY_TO_OUTCOME = bytes(_KEY_TO_OUTCOME)
+
+# any byte value -> 0/1 (truthiness of a small int)
+_TRUTH = bytes([0]) + bytes([1]) * 255
+
+
+def _as_mask(values):
+    """0/1 bytearray from a column of bools (or small ints, or any truthy values)."""
+    try:
+        return bytearray(values).translate(_TRUTH)  # bools are ints: copied in C
+    except (TypeError, ValueError):
+        return bytearray(map(bool, values))
+
+
+def evaluate_access(ages, has_ids, min_age=18):
+    """Return (Categorical of outcomes, per-branch hit counts) for two columns."""
+    if len(ages) != len(has_ids):
+        raise ValueError(f"column length mismatch: {len(ages)} ages vs {len(has_ids)} has_id values")
+    adult = bytearray(map(operator.ge, ages, repeat(min_age)))
+    has_id = _as_mask(has_ids)
+    key_int = int.from_bytes(adult, "little") * 2 + int.from_bytes(has_id, "little")
+    codes = bytearray(key_int.to_bytes(len(adult), "little").translate(_KEY_TO_OUTCOME))
+    outcomes = Categorical(codes, OUTCOMES)
+    return outcomes, outcomes.value_counts()
+
+
+ages = [20, 20, 15, 42, 17, 18]
+ids = [True, False, True, True, False, 0]
+outcomes, hits = evaluate_access(ages, ids)
+
+print("Section 3: Evaluating the Rule with Masks")
+print("Outcomes:", list(outcomes))
+print("Codes:", list(outcomes.codes))
+print("Per-branch hits:", hits)
+print("Matches the nested if:", list(outcomes) == [check_access(a, i) for a, i in zip(ages, ids)])
+
+# Edge case: columns of different lengths
+try:
+    evaluate_access([20, 30], [True])
+except ValueError as e:
+    print("ValueError:", e)
+
+# Edge case: has_id values that are not bools are tested for truthiness, like 'if has_id'
+print("Truthy has_id values:", list(evaluate_access([30, 30, 30], ["yes", "", 300])[0]))
+
+# Edge case: empty columns
+print("Empty columns:", evaluate_access([], [])[1])
+print()
+
+# ---------------------------------------------------------------------
+# Section 4: Reordering Rules by Frequency
+# In a per-record if/elif, testing the most common outcome first saves
+# comparisons. The hit counts tell us which branch that is.
+
+
+def branches_by_frequency(hits):
+    return sorted(hits, key=hits.get, reverse=True)
+
+
+N = 1_000_000
+random.seed(7)
+batch_ages = [random.randint(10, 80) for _ in range(N)]
+batch_ids = [random.random() < 0.9 for _ in range(N)]
+
+print(f"Section 4: Reordering Rules by Frequency ({N:,} records)")
+start = time.perf_counter()
+batch_outcomes, batch_hits = evaluate_access(batch_ages, batch_ids)
+batched_time = time.perf_counter() - start
+total = sum(batch_hits.values())
+for name in branches_by_frequency(batch_hits):
+    print(f"  {name:<15} {batch_hits[name]:>9,}  ({batch_hits[name] / total:6.1%})")
+print("  Suggested branch order:", branches_by_frequency(batch_hits))
+print()
+
+# ---------------------------------------------------------------------
+# Section 5: Benchmark
+
+print("Section 5: Benchmark")
+start = time.perf_counter()
+per_record = [check_access(a, i) for a, i in zip(batch_ages, batch_ids)]
+print(f"  nested if per record:   {(time.perf_counter() - start) * 1000:8.1f} ms")
+print(f"  batched masks + counts: {batched_time * 1000:8.1f} ms")
+print("  Same outcomes:", per_record == list(batch_outcomes))
+print(f"  Memory - list of str: {sys.getsizeof(per_record):,} B (pointers only) | "
+      f"categorical codes: {sys.getsizeof(batch_outcomes.codes):,} B")
+print()
+
+# ---------------------------------------------------------------------
+# Section 6: Summary and Key Takeaways
+
+print("Section 6: Summary and Key Takeaways")
+variables = {
+    "outcomes": type(outcomes).__name__,
+    "codes": type(outcomes.codes).__name__,
+    "hits": type(hits).__name__,
+}
+print("Variable types:", variables)
+
+print("""
+Key Takeaways:
+- Each condition becomes a 0/1 mask computed over a whole column.
+- Combining masks into a small key turns nested ifs into a table lookup.
+- Store outcomes as codes plus category names to save memory.
+- Count hits per branch to decide which condition to test first.
+""")
@@ -0,0 +1,258 @@
+"""
+Parallel First-Match Search: A Concise Educational Guide
+
+3breakContinuePass.py finds the first even number with a for loop and
+`break`. This script runs the same kind of search over very large ranges and
+sequences with a pool of worker processes. It covers:
+- Splitting the input into chunks that workers search independently
+- Cancelling later chunks as soon as a match is found
+- Still returning the lowest-index match, exactly what `break` gives
+- Scaling from 1 to N cores, measured against the plain loop
+
+Worker processes import the predicate by name, so it must be a module-level
+function (not a lambda), and the demo runs under `if __name__ == "__main__"`.
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import compress, count, islice
+
+NOT_FOUND = sys.maxsize
+CHECK_EVERY = 4096  # items a worker scans between checks for cancellation
+
+# ---------------------------------------------------------------------
+# Section 1: Searching One Chunk
+# A chunk is a slice of the input plus the index where it starts. The worker
+# scans it in small blocks; before each block it reads the shared "best index
+# found so far" and gives up if a match was already found earlier in the
+# input, because nothing in this chunk could be the first match any more.
+
+_best = None  # shared multiprocessing.Value in workers, None in-process
+
+
+def _init_worker(best):
+    global _best
+    _best = best
+
+
+def _search_chunk(predicate, start, chunk):
+    """Return (index, item) of the first match in chunk, or None."""
+    for block_start in range(0, len(chunk), CHECK_EVERY):
+        if _best is not None and _best.value < start:
+            return None  # cancelled: an earlier chunk already matched
+        block = chunk[block_start:block_start + CHECK_EVERY]
+        # compress(count(), matches) yields offsets of True results; the loop runs in C.
+        offset = next(compress(count(), map(predicate, block)), None)
+        if offset is not None:
+            index = start + block_start + offset
+            if _best is not None:
+                with _best.get_lock():
+                    if index < _best.value:
+                        _best.value = index
+            return index, block[offset]
+    return None
+
+
+# ---------------------------------------------------------------------
+# Section 2: Splitting the Input into Chunks
+# Ranges and sequences are sliced (a sliced range is tiny to send to a
+# worker). Other iterables, including dicts and sets, are consumed lazily
+# into lists, so an infinite generator is fine as long as it eventually matches.
+
+
+def _sliceable(source):
+    return isinstance(source, (range, Sequence))
+
+
+def _chunks(source, chunk_size):
+    if _sliceable(source):
+        for start in range(0, len(source), chunk_size):
+            yield start, source[start:start + chunk_size]
+    else:
+        iterator = iter(source)
+        for start in count(0, chunk_size):
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield start, chunk
+
+
+# ---------------------------------------------------------------------
+# Section 3: The Engine
+# Chunks are submitted in input order, a few per worker at a time. When a
+# chunk reports a match:
+# - chunks starting after it are cancelled (queued ones never run; running
+#   ones stop at their next check),
+# - no new chunks are submitted,
+# - chunks starting before it still finish, since one of them may hold an
+#   earlier match. The lowest index wins, just like `break`.
+# An exception from the predicate is handled the same way, as an event at its
+# chunk's start: it is raised only if no match comes before that chunk, which
+# is exactly when the plain loop would have raised it too.
+
+
+def find_first(source, predicate, workers=None, chunk_size=100_000):
+    """Return (index, item) of the first item where predicate(item) is true, or None."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    if _sliceable(source) and len(source) <= chunk_size:
+        return _search_chunk(predicate, 0, source)  # one chunk: a pool would only add overhead
+
+    best = multiprocessing.Value("q", NOT_FOUND)
+    found = None
+    error = None  # (chunk start, exception) of the earliest failed chunk
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(best,)) as pool:
+        chunks = _chunks(source, chunk_size)
+        running = {}
+        exhausted = False
+        while True:
+            while found is None and error is None and not exhausted and len(running) < workers * 2:
+                next_chunk = next(chunks, None)
+                if next_chunk is None:
+                    exhausted = True
+                else:
+                    start, chunk = next_chunk
+                    running[pool.submit(_search_chunk, predicate, start, chunk)] = start
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk_start = running.pop(future)
+                if future.cancelled():
+                    continue
+                try:
+                    result = future.result()
+                except Exception as exc:  # the predicate raised inside this chunk
+                    if error is not None and error[0] < chunk_start:
+                        continue
+                    error = (chunk_start, exc)
+                    event = chunk_start
+                else:
+                    if result is None or (found is not None and found[0] < result[0]):
+                        continue
+                    found = result
+                    event = found[0]
+                with best.get_lock():
+                    best.value = min(best.value, event)
+                for other, start in running.items():
+                    if start > event:
+                        other.cancel()
+    if error is not None and (found is None or error[0] < found[0]):
+        raise error[1]
+    return found
+
+
+# ---------------------------------------------------------------------
+# Predicates (module level, so worker processes can find them by name)
+
+
+def is_even(number):
+    return number % 2 == 0
+
+
+def is_multiple_of_3000017(number):
+    return number % 3_000_017 == 0
+
+
+def raises_after_9999(number):
+    """Matches at 9,999 and fails at 10,001 and above."""
+    if number > 10_000:
+        return 1 / 0
+    return number == 9_999
+
+
+def break_loop(source, predicate):
+    """The plain for/break search, returning the same (index, item) pair."""
+    for index, item in enumerate(source):
+        if predicate(item):
+            return index, item
+    return None
+
+
+def lesson():
+    # Section 4: Same Answer as break
+    print("Section 4: Same Answer as break")
+    print("break loop over range(1, 6):", break_loop(range(1, 6), is_even))    # Output: (1, 2)
+    print("find_first(range(1, 6)):    ", find_first(range(1, 6), is_even))  # Output: (1, 2)
+
+    # Several chunks contain matches; the lowest index still wins.
+    numbers = [1, 3, 5] * 100_000 + [8, 10, 12]
+    numbers[250_000] = 4
+    numbers[150_000] = 2
+    print("Two matches in different chunks:", find_first(numbers, is_even, workers=2, chunk_size=10_000))
+
+    # Edge case: any iterable works, including a generator (consumed chunk by chunk)
+    squares = (n * n for n in count(1))
+    print("First even square from a generator:", find_first(squares, is_even, chunk_size=1_000))
+
+    # Edge case: no match returns None, like a loop that never breaks
+    print("No match:", find_first(range(1, 300_000, 2), is_even, workers=2, chunk_size=50_000))
+
+    # Edge case: dicts and sets are searched in iteration order, like a for loop over them
+    ages = {"Ann": 17, "Bob": 21, "Cy": 30}
+    print("First even age (dict values):", find_first(ages.values(), is_even))
+    print("First key (dict):", find_first(ages, str.isalpha))
+
+    # Edge case: a predicate error after the first match is never reached, as with break
+    print("Error after the match:", find_first(range(20_000), raises_after_9999, workers=2, chunk_size=10_000))
+    try:
+        find_first(range(10_000, 30_000), raises_after_9999, workers=2, chunk_size=5_000)
+    except ZeroDivisionError as e:
+        print("Error before any match -> ZeroDivisionError:", e)
+
+    # Edge case: chunk_size must be positive
+    try:
+        find_first(range(10), is_even, chunk_size=0)
+    except ValueError as e:
+        print("ValueError:", e)
+    print()
+
+    # Section 5: Scaling from 1 to N Cores
+    # The match sits about 3 million items into a range of a billion; the
+    # workers never touch the rest of the range.
+    source = range(1, 1_000_000_000)
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, cores} | {n for n in (2, 4, 8, 16, 32) if n < cores})
+
+    print(f"Section 5: Scaling (first multiple of 3,000,017 in a range of {len(source):,})")
+    start = time.perf_counter()
+    expected = break_loop(source, is_multiple_of_3000017)
+    baseline = time.perf_counter() - start
+    print(f"  for/break loop:    {baseline * 1000:8.1f} ms  -> {expected}")
+    for workers in worker_counts:
+        start = time.perf_counter()
+        result = find_first(source, is_multiple_of_3000017, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"  {workers:>2} worker(s):      {elapsed * 1000:8.1f} ms  "
+              f"speedup {baseline / elapsed:4.2f}x  same answer: {result == expected}")
+    if cores == 1:
+        print("  Only one core is available here, so the pool can't beat the plain loop;")
+        print("  on an N-core machine the same run scales until the pool overhead dominates.")
+    print()
+
+    # Section 6: Summary and Key Takeaways
+    print("Section 6: Summary and Key Takeaways")
+    variables = {
+        "source": type(source).__name__,
+        "expected": type(expected).__name__,
+        "numbers": type(numbers).__name__,
+    }
+    print("Variable types:", variables)
+
+    print("""
+Key Takeaways:
+- Split the input into ordered chunks and search them in parallel.
+- A shared 'best index' lets workers stop early once an earlier match exists.
+- Later chunks can be cancelled; earlier ones must finish to keep break's answer.
+- Predicates for a process pool must be module-level functions.
+- For small inputs a plain loop is faster than starting worker processes.
+""")
+
+
+if __name__ == "__main__":
+    lesson()
@@ -0,0 +1,174 @@
+"""
+Grid Search: A Concise Educational Guide
+
+The nested-loop example in 3breakContinuePass.py breaks out of the inner loop
+at the first matching j, then moves on to the next i. Scanning a 2D
+parameter grid for "the first hit in each row" has the same shape. This
+script does that search block by block. It covers:
+- Block predicates: test a whole block of j values at once, giving a 0/1 mask
+- Finding the first hit in a mask (the argmax of the mask) with bytearray.find
+- Dropping a row from the search as soon as it has a hit
+- A benchmark against the nested Python loops with break
+"""
+
+import operator
+import time
+from array import array
+from itertools import repeat
+
+# ---------------------------------------------------------------------
+# Section 1: The Nested Loops
+
+print("Section 1: The Nested Loops")
+for i in range(2):
+    for j in range(3):
+        if j == 1:
+            print(f"First hit in row i={i}: j={j}")
+            break
+print()
+
+# ---------------------------------------------------------------------
+# Section 2: Block Predicates
+# A block predicate receives one i and a block of j values and returns a 0/1
+# bytearray mask, one byte per j. Building the mask with map() and operator
+# functions keeps the per-j work in C. elementwise() adapts an ordinary
+# predicate(i, j) when no block version is available.
+
+
+def elementwise(predicate):
+    """Turn predicate(i, j) -> truthy value into a block predicate (i, js) -> mask."""
+    def block_predicate(i, js):
+        # bool() maps any truthy result (2, "yes", a non-empty list) to 1, so find(1) sees it.
+        return bytearray(map(bool, map(predicate, repeat(i, len(js)), js)))
+    return block_predicate
+
+
+def j_equals_1(i, js):
+    return bytearray(map(operator.eq, js, repeat(1)))
+
+
+print("Section 2: Block Predicates")
+print("j_equals_1(0, range(3)):", list(j_equals_1(0, range(3))))  # Output: [0, 1, 0]
+print("First hit (argmax of the mask):", j_equals_1(0, range(3)).find(1))  # Output: 1
+print("No hit gives -1:", j_equals_1(0, range(5, 8)).find(1))
+print("Truthy results count as hits:", elementwise(lambda i, j: j % 4 * 2)(0, range(3)).find(1))  # Output: 1
+print()
+
+# ---------------------------------------------------------------------
+# Section 3: Searching the Grid Block by Block
+# The j axis is split into blocks. Each block is tested only for rows that
+# have no hit yet; a row that finds one is dropped, so its remaining blocks
+# are never evaluated. The result holds the position of the first hit in
+# `columns` for each row, or -1 if the row has none.
+
+
+def first_hits(rows, columns, block_predicate, block_size=256):
+    """Return (positions, stats): the first j position with a hit for each i (-1 if none)."""
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1")
+    positions = array("q", [-1]) * len(rows)
+    active = list(range(len(rows)))
+    stats = {"blocks_evaluated": 0, "blocks_in_grid": len(rows) * -(-len(columns) // block_size)}
+    for block_start in range(0, len(columns), block_size):
+        if not active:
+            break
+        block = columns[block_start:block_start + block_size]
+        still_active = []
+        for row in active:
+            hit = block_predicate(rows[row], block).find(1)
+            if hit >= 0:
+                positions[row] = block_start + hit
+            else:
+                still_active.append(row)
+        stats["blocks_evaluated"] += len(active)
+        active = still_active
+    return positions, stats
+
+
+positions, stats = first_hits(range(2), range(3), j_equals_1, block_size=2)
+print("Section 3: Searching the Grid Block by Block")
+print("First hit per row:", positions.tolist())  # Output: [1, 1]
+print("Stats:", stats)
+
+# A grid where some rows never hit: the first j with i * j >= 20
+columns = [1, 2, 3, 4, 5, 6, 7, 8]
+at_least_20 = elementwise(lambda i, j: i * j >= 20)
+positions, stats = first_hits([1, 3, 5, 10], columns, at_least_20, block_size=3)
+print("First j with i * j >= 20:",
+      {i: (columns[p] if p >= 0 else None) for i, p in zip([1, 3, 5, 10], positions)})
+print("Stats:", stats)
+
+# Edge case: empty grid
+print("Empty grid:", first_hits([], range(10), j_equals_1)[0].tolist())
+
+# Edge case: block_size must be positive
+try:
+    first_hits(range(2), range(3), j_equals_1, block_size=0)
+except ValueError as e:
+    print("ValueError:", e)
+print()
+
+# ---------------------------------------------------------------------
+# Section 4: Benchmark
+# Grid: i in 1..1000, j in 0..1999, hit where i * j % 1000 == 999.
+# Rows whose i shares a factor with 1000 (even i, or multiples of 5) never
+# hit and are scanned to the end; the others stop early.
+
+ROWS = range(1, 1001)
+COLUMNS = range(2000)
+
+
+def hit_mask(i, js):
+    products = range(js.start * i, js.stop * i, js.step * i)  # i * j for a range block of j
+    return bytearray(map(operator.eq, map(operator.mod, products, repeat(1000)), repeat(999)))
+
+
+def nested_loops(rows, columns):
+    positions = []
+    for i in rows:
+        for position, j in enumerate(columns):
+            if i * j % 1000 == 999:
+                positions.append(position)
+                break
+        else:
+            positions.append(-1)
+    return positions
+
+
+print(f"Section 4: Benchmark ({len(ROWS):,} x {len(COLUMNS):,} grid)")
+start = time.perf_counter()
+loop_positions = nested_loops(ROWS, COLUMNS)
+print(f"  nested loops with break:  {(time.perf_counter() - start) * 1000:8.1f} ms")
+for block_size in (64, 512):
+    start = time.perf_counter()
+    grid_positions, stats = first_hits(ROWS, COLUMNS, hit_mask, block_size=block_size)
+    print(f"  blocks of {block_size:<4}            {(time.perf_counter() - start) * 1000:8.1f} ms  "
+          f"({stats['blocks_evaluated']:,} of {stats['blocks_in_grid']:,} blocks evaluated)")
+print("  Same positions:", loop_positions == grid_positions.tolist())
+print("  Rows with a hit:", sum(1 for p in loop_positions if p >= 0), "of", len(ROWS))
+# Without NumPy each mask still makes one C-level call per j, so for a cheap
+# predicate like this one the blocks are somewhat slower than the loop. The
+# structure pays off when a block can be tested in one call (NumPy, a
+# database query, a compiled function): fewer, larger calls and no wasted
+# blocks after a row's hit.
+print()
+
+# ---------------------------------------------------------------------
+# Section 5: Summary and Key Takeaways
+
+print("Section 5: Summary and Key Takeaways")
+variables = {
+    "positions": type(positions).__name__,
+    "stats": type(stats).__name__,
+    "mask": type(hit_mask(1, range(3))).__name__,
+}
+print("Variable types:", variables)
+
+print("""
+Key Takeaways:
+- A block predicate tests many j values in one call and returns a 0/1 mask.
+- mask.find(1) is the first hit in the block, or -1 if there is none.
+- Rows with a hit leave the search, so their later blocks are skipped.
+- Small blocks waste less work after a hit; large blocks have less overhead.
+- Blocks only beat the plain loop when a whole block is tested in one fast call.
+""")
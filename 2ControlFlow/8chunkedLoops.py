@@ -0,0 +1,220 @@
+"""
+Chunked Loop Execution: A Concise Educational Guide
+
+2forWhile.py shows for loops over lists, strings and range(), while loops
+with a counter, `continue` filtering and `for...else`. This script runs the
+same patterns through a small loop executor built for very long sequences.
+It covers:
+- Running a loop body over an iterable in configurable chunks
+- Sampling per-iteration latency cheaply (p50 / p99)
+- Early termination with for...else semantics
+- Progress callbacks between chunks (which can also stop the loop)
+- The overhead of the executor compared with a plain for loop
+"""
+
+import statistics
+import time
+from itertools import count, islice, takewhile
+
+# ---------------------------------------------------------------------
+# Section 1: The Executor
+# The body is called once per item:
+# - returning None (or anything else) moves on to the next item, like the
+#   end of a loop body or `continue`;
+# - returning BREAK stops the loop, like `break`.
+# else_body runs only when the loop was not stopped, exactly like the
+# `else:` block of a for loop.
+#
+# Timing every iteration would cost more than a cheap body itself, so only
+# every `sample_every`-th iteration is timed. Progress callbacks run between
+# chunks, never inside the hot loop.
+#
+# A chunk is an islice() of the iterator that is consumed as the body runs,
+# not a prefetched list, so after BREAK the caller's iterator is left exactly
+# where a plain for/break would leave it.
+
+BREAK = object()  # returned by a body (or progress callback) to stop the loop
+
+
+def run_loop(iterable, body, else_body=None, chunk_size=10_000, sample_every=100, on_progress=None):
+    """Run body(item) for each item in chunks; return a report dict."""
+    if chunk_size < 1 or sample_every < 1:
+        raise ValueError("chunk_size and sample_every must be at least 1")
+    perf_counter_ns = time.perf_counter_ns
+    samples = []
+    report = {"iterations": 0, "chunks": 0, "broke": False, "else_ran": False, "break_item": None}
+    iterator = iter(iterable)
+    started = time.perf_counter()
+    countdown = 0
+    while not report["broke"]:
+        done = 0
+        for item in islice(iterator, chunk_size):  # lazy: nothing is read ahead of the body
+            if countdown:
+                countdown -= 1
+                result = body(item)
+            else:
+                countdown = sample_every - 1
+                before = perf_counter_ns()
+                result = body(item)
+                samples.append(perf_counter_ns() - before)
+            done += 1
+            if result is BREAK:
+                report["broke"] = True
+                report["break_item"] = item
+                break
+        if not done:
+            break  # the iterator is exhausted
+        report["iterations"] += done
+        report["chunks"] += 1
+        if on_progress is not None and not report["broke"]:
+            if on_progress(report["iterations"], time.perf_counter() - started) is BREAK:
+                report["broke"] = True
+    if not report["broke"] and else_body is not None:
+        else_body()
+        report["else_ran"] = True
+    report["elapsed_s"] = time.perf_counter() - started
+    report.update(_latency_summary(samples))
+    return report
+
+
+def _latency_summary(samples):
+    """p50 / p99 of the sampled iteration times, in microseconds."""
+    if len(samples) < 2:
+        only = round(samples[0] / 1000, 3) if samples else None
+        return {"samples": len(samples), "p50_us": only, "p99_us": only}
+    percentiles = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "samples": len(samples),
+        "p50_us": round(percentiles[49] / 1000, 3),
+        "p99_us": round(percentiles[98] / 1000, 3),
+    }
+
+
+# ---------------------------------------------------------------------
+# Section 2: The Patterns from 2forWhile.py
+
+print("Section 2: The Patterns from 2forWhile.py")
+
+seen = []
+run_loop([1, 2, 3, 4], seen.append)
+print("For loop over a list:", seen)  # Output: [1, 2, 3, 4]
+
+seen = []
+run_loop("loop", seen.append)
+print("For loop over a string:", seen)  # Output: ['l', 'o', 'o', 'p']
+
+# while count < 3: ... count += 1  ->  iterate a counter while the condition holds
+seen = []
+run_loop(takewhile(lambda c: c < 3, count()), seen.append)
+print("While loop with a counter:", seen)  # Output: [0, 1, 2]
+
+# continue: return early from the body without doing the rest of the work
+odds = []
+
+
+def keep_odd(i):
+    if i % 2 == 0:
+        return  # continue
+    odds.append(i)
+
+
+run_loop(range(5), keep_odd)
+print("Using continue:", odds)  # Output: [1, 3]
+
+# for...else: else_body runs only if the body never returned BREAK
+report = run_loop(range(3), lambda i: None, else_body=lambda: print("  Loop finished!"))
+print("else ran:", report["else_ran"])  # Output: True
+report = run_loop(range(3), lambda i: BREAK if i == 1 else None, else_body=lambda: print("  not printed"))
+print("Stopped at:", report["break_item"], "| else ran:", report["else_ran"])  # Output: 1 | False
+
+# Edge case: after BREAK, the rest of a shared iterator is untouched, as with break
+numbers = iter(range(10))
+run_loop(numbers, lambda i: BREAK if i == 2 else None)
+print("Left in the iterator after breaking at 2:", list(numbers))  # Output: [3, 4, ..., 9]
+
+# Edge case: empty iterable - the else block still runs, like a for loop
+report = run_loop([], print, else_body=lambda: print("  Empty loop, else still runs"))
+print("Iterations over []:", report["iterations"])
+
+# Edge case: invalid chunk size
+try:
+    run_loop(range(3), print, chunk_size=0)
+except ValueError as e:
+    print("ValueError:", e)
+print()
+
+# ---------------------------------------------------------------------
+# Section 3: Finding Where the Time Goes
+# The body below is cheap for most items but slow for every 37th one (under
+# 3% of items). The median hides the slow items; p99 shows them. The sample
+# stride (10) shares no factor with 37, so samples don't line up with (or
+# miss) the slow items.
+
+N = 200_000
+
+
+def uneven_body(i):
+    if i % 37 == 0:
+        sum(range(500))  # the occasional expensive item
+    return None
+
+
+progress_lines = []
+report = run_loop(
+    range(N), uneven_body, chunk_size=50_000, sample_every=10,
+    on_progress=lambda done, elapsed: progress_lines.append(f"  {done:>7,} items after {elapsed * 1000:6.1f} ms"),
+)
+print(f"Section 3: Finding Where the Time Goes ({N:,} iterations)")
+print("\n".join(progress_lines))
+print(f"  p50: {report['p50_us']} us | p99: {report['p99_us']} us | samples: {report['samples']:,}")
+
+# A progress callback can stop a long run, e.g. after a time budget
+report = run_loop(count(), lambda i: None, chunk_size=10_000,
+                  on_progress=lambda done, elapsed: BREAK if done >= 30_000 else None)
+print("Infinite counter stopped by the progress callback after", f"{report['iterations']:,}", "items")
+print()
+
+# ---------------------------------------------------------------------
+# Section 4: Benchmark - Executor Overhead
+# A trivial body shows the cost of the executor itself.
+
+N = 1_000_000
+total = 0
+
+
+def add_to_total(i):
+    global total
+    total += i
+
+
+print(f"Section 4: Benchmark ({N:,} iterations, trivial body)")
+start = time.perf_counter()
+for i in range(N):
+    add_to_total(i)
+print(f"  plain for loop calling the body:   {(time.perf_counter() - start) * 1000:8.1f} ms")
+for sample_every in (1, 100, 10_000):
+    report = run_loop(range(N), add_to_total, sample_every=sample_every)
+    print(f"  run_loop, sample every {sample_every:<6}      {report['elapsed_s'] * 1000:8.1f} ms "
+          f"(p50 {report['p50_us']} us, {report['samples']:,} samples)")
+print()
+
+# ---------------------------------------------------------------------
+# Section 5: Summary and Key Takeaways
+
+print("Section 5: Summary and Key Takeaways")
+variables = {
+    "report": type(report).__name__,
+    "iterations": type(report["iterations"]).__name__,
+    "p50_us": type(report["p50_us"]).__name__,
+    "BREAK": type(BREAK).__name__,
+}
+print("Variable types:", variables)
+
+print("""
+Key Takeaways:
+- Chunking a long loop gives natural points for progress reports and stopping.
+- Timing every iteration is expensive; sampling every Nth keeps overhead low.
+- p50 shows the typical iteration, p99 shows the slow outliers.
+- A BREAK sentinel and an else_body reproduce break and for...else; the chunks
+  are read lazily, so nothing past the BREAK item is taken from the iterator.
+""")
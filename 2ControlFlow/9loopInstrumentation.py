@@ -0,0 +1,291 @@
+"""
+Loop Instrumentation: A Concise Educational Guide
+
+The loops in this folder break, continue and run to the end, but a profiler
+only tells us which *functions* are slow. This script adds a small probe for
+the loops themselves. It covers:
+- A context manager that wraps a loop's iterable and times each run
+- Counting iterations, skipped (`continue`) iterations and early exits
+- Sampling: only every Nth run is counted in detail, to keep overhead low
+- Aggregating across calls and exporting the results as JSON
+- Measuring the overhead against an uninstrumented loop
+"""
+
+import json
+import time
+import timeit
+from itertools import chain, count
+from operator import itemgetter
+
+# ---------------------------------------------------------------------
+# Section 1: The Probe
+# `with probe.run(iterable) as loop: for item in loop: ...`
+#
+# Every run is timed (two clock reads per run, not per iteration). Every
+# `sample_every`-th run is also counted in detail:
+# - iterations: the iterable is zipped with an itertools.count(), so the
+#   counting happens in C with no Python code per item;
+# - early exits: a marker is chained after the iterable; if the loop never
+#   reaches it, the loop ended early (break, return or an exception);
+# - skips: the loop body calls loop.skip() before `continue` (a skipped
+#   iteration can't be seen from outside the loop body).
+# Other runs get the plain iterable back, so they cost almost nothing.
+
+PROBES = {}  # name -> LoopProbe, so results from all loops can be exported together
+
+
+class _Run:
+    """One run of an instrumented loop: iterate it, call skip() before continue."""
+
+    def __init__(self, iterable, sampled):
+        self.sampled = sampled
+        self.skips = 0
+        self.finished = False
+        if sampled:
+            self._counter = count()
+            self._items = map(itemgetter(0), zip(chain(iterable, self._end_marker()), self._counter))
+        else:
+            self._items = iterable
+
+    def _end_marker(self):
+        self.finished = True
+        return
+        yield  # makes this a generator that yields nothing
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def skip(self):
+        self.skips += 1
+
+    def iterations(self):
+        # The counter advanced once per item handed to the loop.
+        return next(self._counter)
+
+
+class LoopProbe:
+    """Aggregated, sampled statistics for one loop in the code."""
+
+    def __init__(self, name, sample_every=100):
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        self.name = name
+        self.sample_every = sample_every
+        self.calls = 0
+        self.total_time_s = 0.0
+        self.sampled_calls = 0
+        self.iterations = 0
+        self.skips = 0
+        self.early_exits = 0
+        PROBES[name] = self
+
+    def run(self, iterable):
+        return _ProbeContext(self, iterable)
+
+    def _record(self, run, elapsed):
+        self.calls += 1
+        self.total_time_s += elapsed
+        if run.sampled:
+            self.sampled_calls += 1
+            self.iterations += run.iterations()
+            self.skips += run.skips
+            self.early_exits += not run.finished
+
+    def summary(self):
+        """Counts from sampled runs plus per-run estimates for all runs."""
+        sampled = self.sampled_calls or None
+        per_run = self.iterations / sampled if sampled else None
+        return {
+            "calls": self.calls,
+            "sampled_calls": self.sampled_calls,
+            "total_time_ms": round(self.total_time_s * 1000, 3),
+            "avg_time_us": round(self.total_time_s / self.calls * 1e6, 3) if self.calls else None,
+            "iterations_sampled": self.iterations,
+            "iterations_per_run": round(per_run, 2) if sampled else None,
+            "estimated_iterations": round(per_run * self.calls) if sampled else None,
+            "continue_rate": round(self.skips / self.iterations, 4) if self.iterations else None,
+            "early_exit_rate": round(self.early_exits / sampled, 4) if sampled else None,
+        }
+
+
+class _ProbeContext:
+    def __init__(self, probe, iterable):
+        self.probe = probe
+        self.iterable = iterable
+
+    def __enter__(self):
+        probe = self.probe
+        self.loop = _Run(self.iterable, sampled=probe.calls % probe.sample_every == 0)
+        self.start = time.perf_counter()
+        return self.loop
+
+    def __exit__(self, exc_type, exc, tb):
+        self.probe._record(self.loop, time.perf_counter() - self.start)
+        return False  # never swallow exceptions
+
+
+def export_json(path=None):
+    """All probes' summaries as a JSON string; also written to path if given."""
+    text = json.dumps({name: probe.summary() for name, probe in sorted(PROBES.items())}, indent=2)
+    if path is not None:
+        with open(path, "w") as file:
+            file.write(text)
+    return text
+
+
+# ---------------------------------------------------------------------
+# Section 2: Instrumenting the Loops from this Folder
+# sample_every=1 counts every run, so the small examples are exact.
+
+first_even = LoopProbe("first_even", sample_every=1)
+print("Section 2: Instrumenting the Loops from this Folder")
+for upper in (6, 2, 10):
+    with first_even.run(range(1, upper)) as loop:
+        for num in loop:
+            if num % 2 == 0:
+                break
+print("first_even:", first_even.summary())
+
+odd_printer = LoopProbe("print_odds", sample_every=1)
+with odd_printer.run(range(5)) as loop:
+    for i in loop:
+        if i % 2 == 0:
+            loop.skip()
+            continue
+        print("Odd number:", i)
+print("print_odds:", odd_printer.summary())
+
+# Edge case: an exception leaving the loop counts as an early exit and is not swallowed
+failing = LoopProbe("failing_loop", sample_every=1)
+try:
+    with failing.run([1, 2, 0, 4]) as loop:
+        for value in loop:
+            10 / value
+except ZeroDivisionError as e:
+    print("ZeroDivisionError:", e, "| early exits:", failing.summary()["early_exit_rate"])
+
+# Edge case: an empty iterable finishes normally with zero iterations
+empty = LoopProbe("empty_loop", sample_every=1)
+with empty.run([]) as loop:
+    for _ in loop:
+        pass
+print("empty_loop iterations:", empty.summary()["iterations_sampled"])
+
+# Edge case: invalid sampling rate
+try:
+    LoopProbe("bad", sample_every=0)
+except ValueError as e:
+    print("ValueError:", e)
+print()
+
+# ---------------------------------------------------------------------
+# Section 3: Sampling, Aggregation and JSON Export
+# 1,000 calls, every 10th counted in detail. Estimates scale the sampled
+# counts up to all calls.
+
+filter_probe = LoopProbe("filter_multiples_of_3", sample_every=10)
+
+
+def count_multiples_of_3(limit):
+    found = 0
+    with filter_probe.run(range(limit)) as loop:
+        for n in loop:
+            if n % 3:
+                loop.skip()
+                continue
+            found += 1
+            if found == 50:
+                break
+    return found
+
+
+for call in range(1_000):
+    count_multiples_of_3(100 + call % 200)
+
+print("Section 3: Sampling, Aggregation and JSON Export")
+print(export_json())
+print()
+
+# ---------------------------------------------------------------------
+# Section 4: Benchmark - Overhead
+# 200 runs of a 10,000-iteration loop with a small body. The overhead of the
+# detailed counting is per item; sampling spreads it over 1 in N runs.
+#
+# A 1% difference is smaller than the run-to-run noise of a shared machine,
+# so the expected overhead is also built from two large, stable measurements
+# (each the minimum of timeit.repeat):
+# - the fixed cost of the `with` block, timed on an empty loop;
+# - the extra cost of a counted run, which is about as slow as two plain runs.
+# Expected overhead for sampling 1 in N = (fixed + counted extra / N) / plain run.
+
+RUNS, SIZE = 200, 10_000
+
+
+def plain_loop(size=SIZE):
+    total = 0
+    for n in range(size):
+        total += n
+    return total
+
+
+def probed_loop(probe, size=SIZE):
+    total = 0
+    with probe.run(range(size)) as loop:
+        for n in loop:
+            total += n
+    return total
+
+
+def best_time(function, number=RUNS):
+    return min(timeit.repeat(function, number=number, repeat=7)) / number
+
+
+never_counted = LoopProbe("overhead_never", sample_every=10 ** 9)
+never_counted.calls = 1  # skip the first run, which is always sampled
+always_counted = LoopProbe("overhead_every_1", sample_every=1)
+plain_run = best_time(plain_loop)
+counted_extra = best_time(lambda: probed_loop(always_counted)) - plain_run
+fixed = best_time(lambda: probed_loop(never_counted, 0), 10_000) - best_time(lambda: plain_loop(0), 10_000)
+
+print(f"Section 4: Benchmark ({RUNS} runs x {SIZE:,} iterations)")
+print(f"  uninstrumented run:      {plain_run * 1e6:8.1f} us")
+print(f"  counted run:             {(plain_run + counted_extra) * 1e6:8.1f} us  "
+      f"(+{counted_extra / plain_run:.0%})")
+print(f"  fixed cost per run:      {fixed * 1e6:8.2f} us")
+# Direct measurement: the variants take turns, so slow phases of the machine hit all of them.
+variants = {"plain": plain_loop}
+for sample_every in (10, 100):
+    probe = LoopProbe(f"overhead_every_{sample_every}", sample_every=sample_every)
+    variants[sample_every] = lambda probe=probe: probed_loop(probe)
+measured = dict.fromkeys(variants, float("inf"))
+for _ in range(7):
+    for key, function in variants.items():
+        measured[key] = min(measured[key], *timeit.repeat(function, number=RUNS, repeat=1))
+for sample_every in (10, 100):
+    expected = (fixed + counted_extra / sample_every) / plain_run
+    print(f"  sample every {sample_every:<3} run:    measured {(measured[sample_every] / measured['plain'] - 1) * 100:+6.1f}% | "
+          f"expected {expected * 100:+5.1f}%")
+print("  The default sample_every=100 keeps the overhead to a few percent (about 1-2%")
+print("  expected); the measured column also carries a few percent of timing noise.")
+print()
+
+# ---------------------------------------------------------------------
+# Section 5: Summary and Key Takeaways
+
+print("Section 5: Summary and Key Takeaways")
+variables = {
+    "PROBES": type(PROBES).__name__,
+    "first_even": type(first_even).__name__,
+    "summary": type(first_even.summary()).__name__,
+    "export": type(export_json()).__name__,
+}
+print("Variable types:", variables)
+
+print("""
+Key Takeaways:
+- Time each loop run as a whole; never read the clock per iteration.
+- zip() with itertools.count() counts iterations without Python code per item.
+- A marker chained after the iterable tells whether the loop ran to the end.
+- A counted run costs about twice a plain one; sampling 1 run in 100 keeps overhead to a few percent.
+- Scale the sampled counts up to all runs for estimates.
+""")
@@ -0,0 +1,223 @@
+"""
+Adaptive Membership Index: A Concise Educational Guide
+
+'42 in numbers' (1lists.py) and '2 in lst' (3operators.py) scan the list from
+the front, so each check is O(n). Repeating the check in a loop over the same
+list makes the work quadratic. This script introduces IndexedList, a list
+wrapper that counts membership queries and, once they pass a threshold,
+builds a hash index (value -> count) that it keeps up to date on append,
+insert, remove and pop, so later checks are O(1).
+"""
+
+import time
+from collections import Counter
+
+# ---------------------------------------------------------------------
+# 1. Why Repeated 'in' Checks Are Slow
+# Each 'in' walks the list until it finds a match (or reaches the end).
+
+numbers = [5, 3, 42, 8]
+print("Is 42 in numbers?", 42 in numbers)  # checks 5, 3, then 42
+print("Is 99 in numbers?", 99 in numbers)  # checks every item
+print()
+
+
+# ---------------------------------------------------------------------
+# 2. IndexedList: Build an Index Only When It Pays Off
+# A few checks are cheapest as plain scans. After `threshold` checks, the
+# list builds a Counter (value -> how many times it appears). Counts are
+# needed because lists can hold duplicates: removing one 7 must not make
+# '7 in lst' false while another 7 is still there.
+
+class IndexedList:
+    """List wrapper that switches to a hash index after repeated 'in' checks."""
+
+    def __init__(self, items=(), threshold=8):
+        self._items = list(items)
+        self._index = None
+        self._indexable = True  # False once an unhashable item is seen
+        self.threshold = threshold
+        self.stats = {
+            "queries": 0,
+            "linear_scans": 0,
+            "index_hits": 0,
+            "index_built_at_query": None,
+            "index_updates": 0,
+        }
+
+    # Membership -------------------------------------------------------
+
+    def __contains__(self, value):
+        self.stats["queries"] += 1
+        if self._index is None and self._indexable and self.stats["queries"] > self.threshold:
+            self._build_index()
+        if self._index is not None:
+            try:
+                found = value in self._index
+            except TypeError:  # unhashable query, e.g. a list
+                pass
+            else:
+                self.stats["index_hits"] += 1
+                return found
+        self.stats["linear_scans"] += 1
+        return value in self._items
+
+    def _build_index(self):
+        try:
+            self._index = Counter(self._items)
+        except TypeError:
+            self._indexable = False
+            return
+        self.stats["index_built_at_query"] = self.stats["queries"]
+
+    def _index_add(self, value):
+        if self._index is None:
+            return
+        try:
+            self._index[value] += 1
+        except TypeError:
+            self._index = None  # unhashable item: fall back to scanning
+            self._indexable = False
+            return
+        self.stats["index_updates"] += 1
+
+    def _index_remove(self, value):
+        if self._index is None:
+            return
+        self._index[value] -= 1
+        if self._index[value] == 0:
+            del self._index[value]
+        self.stats["index_updates"] += 1
+
+    # List methods that change contents keep the index in sync ---------
+
+    def append(self, value):
+        self._items.append(value)
+        self._index_add(value)
+
+    def insert(self, position, value):
+        self._items.insert(position, value)
+        self._index_add(value)
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def remove(self, value):
+        self._items.remove(value)  # raises ValueError if missing, like list
+        self._index_remove(value)
+
+    def pop(self, position=-1):
+        value = self._items.pop(position)
+        self._index_remove(value)
+        return value
+
+    def __setitem__(self, position, value):
+        if isinstance(position, slice):
+            raise TypeError("slice assignment is not supported")
+        self._index_remove(self._items[position])
+        self._items[position] = value
+        self._index_add(value)
+
+    def __delitem__(self, position):
+        if isinstance(position, slice):
+            raise TypeError("slice deletion is not supported")
+        self._index_remove(self._items[position])
+        del self._items[position]
+
+    # Read-only list behaviour ----------------------------------------
+
+    def count(self, value):
+        if self._index is not None:
+            try:
+                return self._index[value]
+            except TypeError:  # unhashable query
+                pass
+        return self._items.count(value)
+
+    def __getitem__(self, position):
+        return self._items[position]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __repr__(self):
+        return f"IndexedList({self._items!r})"
+
+
+# ---------------------------------------------------------------------
+# 3. Using IndexedList
+
+lst = IndexedList([1, 2, 3, 7, 7], threshold=3)
+for value in [2, 9, 7]:
+    print(f"{value} in lst? {value in lst}")
+print("Stats after 3 checks (still scanning):", lst.stats)
+
+print("4 in lst?", 4 in lst)  # 4th check: index is built now
+print("Stats after index build:", lst.stats)
+
+lst.append(4)
+lst.remove(7)
+print("After append(4) and remove(7):", lst)
+print("4 in lst?", 4 in lst, "| 7 in lst?", 7 in lst, "| count(7):", lst.count(7))
+lst.pop()
+lst.remove(7)
+print("After pop() and remove(7):", lst, "| 7 in lst?", 7 in lst)
+print("Final stats:", lst.stats)
+print()
+
+# Edge cases: unhashable items fall back to linear scans
+mixed = IndexedList([[1, 2], 3], threshold=0)
+print("[1, 2] in mixed?", [1, 2] in mixed, "| stats:", mixed.stats)
+
+# Edge case: removing a missing value raises ValueError, just like a list
+try:
+    lst.remove(100)
+except ValueError as e:
+    print("ValueError:", e)
+print()
+
+
+# ---------------------------------------------------------------------
+# 4. Benchmark: Repeated Membership Checks on the Same List
+
+N = 10_000
+QUERIES = 10_000
+plain = list(range(N))
+indexed = IndexedList(range(N))
+lookups = [(i * 7919) % (2 * N) for i in range(QUERIES)]  # about half are misses
+
+print(f"Benchmark ({QUERIES:,} 'in' checks on a {N:,}-item list):")
+start = time.perf_counter()
+plain_hits = sum(1 for value in lookups if value in plain)
+print(f"  list:        {(time.perf_counter() - start) * 1000:9.1f} ms")
+start = time.perf_counter()
+indexed_hits = sum(1 for value in lookups if value in indexed)
+print(f"  IndexedList: {(time.perf_counter() - start) * 1000:9.1f} ms")
+print("  Same answers:", plain_hits == indexed_hits)
+print("  IndexedList stats:", indexed.stats)
+print()
+
+
+# ---------------------------------------------------------------------
+# 5. Summary and Key Takeaways
+
+summary = {
+    "numbers": type(numbers),
+    "lst": type(lst),
+    "stats": type(lst.stats),
+}
+
+print("Summary:")
+for var, typ in summary.items():
+    print(f"{var}: {typ.__name__}")
+print()
+print("Key takeaways:")
+print("- 'in' on a list is a linear scan; on a dict or set it is a hash lookup.")
+print("- Building an index costs one pass, so only do it when checks repeat.")
+print("- Keep counts in the index so duplicates are handled correctly.")
+print("- Every method that changes the list must also update the index.")
+print("- Unhashable items can't be indexed; fall back to scanning.")
@@ -0,0 +1,402 @@
+"""
+Sorted Lists: A Concise Educational Guide
+
+1lists.py keeps a list in order with extend() followed by sort(), and uses
+insert(1, 42) to place items by position. When items keep arriving, sorting
+the whole list again after every batch (or inserting into one huge list) gets
+slow. This script introduces SortedList, which stays sorted on every insert:
+- Items live in many short sorted sublists, found with bisect
+- add/remove only shift items inside one short sublist
+- Positions (index, list[i]) come from a Fenwick tree of sublist lengths
+- count(), 'in' and range queries by value
+- A benchmark against append + sort() and bisect.insort on a flat list
+
+Run with a size argument (e.g. 10000000) to benchmark a larger list.
+"""
+
+import random
+import sys
+import time
+from bisect import bisect_left, bisect_right, insort
+
+# ---------------------------------------------------------------------
+# 1. The Idea
+# A flat sorted list finds a position in O(log n) with bisect, but insert()
+# must shift every item after it: O(n). Splitting the items into sublists of
+# about LOAD items keeps each shift short. _maxes[i] is the largest item of
+# sublist i, so bisect on _maxes picks the sublist.
+#
+#   _lists: [[1, 3, 5], [8, 9, 12], [15, 20]]
+#   _maxes: [5, 12, 20]
+#
+# To turn "sublist i, offset j" into a position in the whole list we need the
+# total length of sublists 0..i-1. A Fenwick (binary indexed) tree over the
+# sublist lengths gives that sum, and updates it, in O(log k) for k sublists.
+
+
+class SortedList:
+    """List that keeps its items in ascending order."""
+
+    LOAD = 1000  # target sublist length; a sublist is split at twice this size
+
+    def __init__(self, iterable=()):
+        self._lists = []
+        self._maxes = []
+        self._tree = None  # Fenwick tree over sublist lengths, rebuilt lazily
+        self._len = 0
+        self.update(iterable)
+
+    # Fenwick tree -----------------------------------------------------
+
+    def _build_tree(self):
+        tree = [0] + [len(sub) for sub in self._lists]
+        size = len(tree) - 1
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, sub_index, delta):
+        if self._tree is None:
+            return  # structure changed; the tree is rebuilt on the next positional query
+        tree = self._tree
+        i = sub_index + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _offset(self, sub_index):
+        """Number of items in the sublists before sub_index."""
+        if self._tree is None:
+            self._build_tree()
+        tree = self._tree
+        total = 0
+        i = sub_index
+        while i:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, position):
+        """(sublist index, offset) of the item at a non-negative position."""
+        if self._tree is None:
+            self._build_tree()
+        tree = self._tree
+        sub_index = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            candidate = sub_index + step
+            if candidate < len(tree) and tree[candidate] <= position:
+                sub_index = candidate
+                position -= tree[candidate]
+            step >>= 1
+        return sub_index, position
+
+    # Adding and removing ----------------------------------------------
+
+    def add(self, value):
+        maxes = self._maxes
+        if not maxes:
+            self._lists.append([value])
+            maxes.append(value)
+            self._tree = None
+        else:
+            i = bisect_right(maxes, value)
+            if i == len(maxes):  # larger than everything: append to the last sublist
+                i -= 1
+                self._lists[i].append(value)
+                maxes[i] = value
+            else:
+                insort(self._lists[i], value)
+            if len(self._lists[i]) > 2 * self.LOAD:
+                self._split(i)
+            else:
+                self._tree_add(i, 1)
+        self._len += 1
+
+    def _split(self, i):
+        sub = self._lists[i]
+        half = len(sub) // 2
+        self._lists[i:i + 1] = [sub[:half], sub[half:]]
+        self._maxes[i:i + 1] = [sub[half - 1], sub[-1]]
+        self._tree = None
+
+    def update(self, iterable):
+        """Add many items. Large batches are merged with one sort instead of item by item."""
+        values = list(iterable)
+        if not values:
+            return
+        if len(values) * 10 < self._len:
+            for value in values:
+                self.add(value)
+            return
+        values.extend(self)
+        values.sort()
+        load = self.LOAD
+        self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes = [sub[-1] for sub in self._lists]
+        self._tree = None
+        self._len = len(values)
+
+    def _delete(self, i, offset):
+        # Sublists may shrink below LOAD; only empty ones are dropped.
+        sub = self._lists[i]
+        del sub[offset]
+        self._len -= 1
+        if sub:
+            self._maxes[i] = sub[-1]
+            self._tree_add(i, -1)
+        else:
+            del self._lists[i]
+            del self._maxes[i]
+            self._tree = None
+
+    def remove(self, value):
+        """Remove one occurrence of value; ValueError if it is missing, like list.remove."""
+        i = bisect_left(self._maxes, value)
+        if i < len(self._maxes):
+            sub = self._lists[i]
+            offset = bisect_left(sub, value)
+            if sub[offset] == value:
+                self._delete(i, offset)
+                return
+        raise ValueError(f"{value!r} not in SortedList")
+
+    def discard(self, value):
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+
+    def pop(self, index=-1):
+        i, offset = self._locate(self._position(index))
+        value = self._lists[i][offset]
+        self._delete(i, offset)
+        return value
+
+    def __delitem__(self, index):
+        self.pop(index)
+
+    # Positions -------------------------------------------------------
+
+    def _position(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        i, offset = self._locate(self._position(index))
+        return self._lists[i][offset]
+
+    def bisect_left(self, value):
+        """Position where value would be inserted before any equal items."""
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        return self._offset(i) + bisect_left(self._lists[i], value)
+
+    def bisect_right(self, value):
+        """Position where value would be inserted after any equal items."""
+        i = bisect_right(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        return self._offset(i) + bisect_right(self._lists[i], value)
+
+    def index(self, value):
+        position = self.bisect_left(value)
+        if position == self._len or self[position] != value:
+            raise ValueError(f"{value!r} is not in SortedList")
+        return position
+
+    def count(self, value):
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def __contains__(self, value):
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return False
+        sub = self._lists[i]
+        return sub[bisect_left(sub, value)] == value
+
+    def irange(self, minimum, maximum):
+        """Items with minimum <= item <= maximum, in order."""
+        i = bisect_left(self._maxes, minimum)
+        lists = self._lists
+        if i == len(lists):
+            return
+        offset = bisect_left(lists[i], minimum)
+        while i < len(lists):
+            sub = lists[i]
+            end = bisect_right(sub, maximum)
+            yield from sub[offset:end]
+            if end < len(sub):
+                return
+            i, offset = i + 1, 0
+
+    # Read-only list behaviour ----------------------------------------
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for sub in self._lists:
+            yield from sub
+
+    def __repr__(self):
+        return f"SortedList({list(self)!r})"
+
+
+# ---------------------------------------------------------------------
+# 2. Using SortedList
+
+scores = SortedList([50, 20, 90, 20])
+print("Created from [50, 20, 90, 20]:", scores)
+scores.add(42)
+scores.update([75, 5])
+print("After add(42) and update([75, 5]):", scores)
+print("First and last:", scores[0], scores[-1])
+print("Slice [1:4]:", scores[1:4])
+print("index(42):", scores.index(42), "| count(20):", scores.count(20), "| 90 in scores?", 90 in scores)
+print("Items between 20 and 60:", list(scores.irange(20, 60)))
+scores.remove(20)
+print("After remove(20):", scores)
+largest = scores.pop()
+smallest = scores.pop(0)
+print("pop():", largest, "| pop(0):", smallest, "| left:", scores)
+print()
+
+# Edge case: there is no insert(position, value) - the position is always decided by the value
+print("Has insert()?", hasattr(scores, "insert"))
+
+# Edge case: missing values raise ValueError, like a list
+try:
+    scores.remove(1000)
+except ValueError as e:
+    print("ValueError:", e)
+
+# Edge case: index out of range
+try:
+    SortedList()[0]
+except IndexError as e:
+    print("IndexError:", e)
+
+# Edge case: items must be comparable with each other
+try:
+    SortedList([1, "two"])
+except TypeError as e:
+    print("TypeError:", e)
+print()
+
+# Check against a plain sorted list with many random operations (many sublists, splits and deletes)
+SortedList.LOAD = 8
+checked = SortedList()
+reference = []
+rng = random.Random(5)
+for step in range(5_000):
+    value = rng.randint(0, 300)
+    if rng.random() < 0.6:
+        checked.add(value)
+        insort(reference, value)
+    elif reference:
+        checked.discard(value)
+        if value in reference:
+            reference.remove(value)
+    if step % 250 == 0 and reference:
+        position = rng.randrange(len(reference))
+        assert checked[position] == reference[position]
+        assert checked.bisect_left(value) == bisect_left(reference, value)
+        assert checked.count(value) == reference.count(value)
+        assert list(checked.irange(100, 200)) == [v for v in reference if 100 <= v <= 200]
+assert list(checked) == reference and len(checked) == len(reference)
+SortedList.LOAD = 1000
+print("Matched a plain sorted list over 5,000 random adds and removes.")
+print()
+
+
+# ---------------------------------------------------------------------
+# 3. Benchmark: Keeping a List Sorted Under Inserts
+# Start from `size` sorted items, then insert 10 batches of 1,000 random
+# items, with the list in order after each batch.
+# - append + sort(): add the batch, then sort the whole list again
+# - insort: bisect.insort each item into the flat list (shifts ~size/2 items)
+# - SortedList.add: insert each item into a short sublist
+
+BATCHES, BATCH_SIZE = 10, 1_000
+
+
+def with_sort(items, batches):
+    for batch in batches:
+        items.extend(batch)
+        items.sort()
+    return items
+
+
+def with_insort(items, batches):
+    for batch in batches:
+        for value in batch:
+            insort(items, value)
+    return items
+
+
+def with_sorted_list(items, batches):
+    for batch in batches:
+        for value in batch:
+            items.add(value)
+    return items
+
+
+sizes = [10_000, 100_000, 1_000_000]
+if len(sys.argv) > 1:
+    sizes.append(int(sys.argv[1]))
+
+print(f"Benchmark ({BATCHES} batches of {BATCH_SIZE:,} random inserts):")
+for size in sizes:
+    initial = sorted(random.random() for _ in range(size))
+    batches = [[random.random() for _ in range(BATCH_SIZE)] for _ in range(BATCHES)]
+    results = []
+    timings = []
+    for label, run, container in [
+        ("append + sort()", with_sort, list(initial)),
+        ("bisect.insort", with_insort, list(initial)),
+        ("SortedList.add", with_sorted_list, SortedList(initial)),
+    ]:
+        start = time.perf_counter()
+        results.append(run(container, batches))
+        timings.append(f"{label}: {(time.perf_counter() - start) * 1000:8.1f} ms")
+    same = results[0] == results[1] == list(results[2])
+    print(f"  {size:>10,} items | " + " | ".join(timings) + f" | same order: {same}")
+
+# Lookups by position and value stay O(log n)
+big = results[2]
+start = time.perf_counter()
+for position in range(0, len(big), len(big) // 10_000):
+    big[position]
+    big.count(0.5)
+print(f"  20,000 positional/count queries on {len(big):,} items: {(time.perf_counter() - start) * 1000:.1f} ms")
+print()
+
+
+# ---------------------------------------------------------------------
+# 4. Summary and Key Takeaways
+
+summary = {
+    "scores": type(scores),
+    "scores._lists": type(scores._lists),
+    "reference": type(reference),
+}
+
+print("Summary:")
+for var, typ in summary.items():
+    print(f"{var}: {typ.__name__}")
+print()
+print("Key takeaways:")
+print("- Re-sorting after every batch repeats work on items that were already in order.")
+print("- insort finds the spot in O(log n) but shifts O(n) items on every insert.")
+print("- Short sublists keep each shift small; bisect on their maximums finds the right one.")
+print("- A Fenwick tree of sublist lengths turns value positions into list positions.")
+print("- A SortedList decides positions itself, so it has add() but no insert().")
@@ -0,0 +1,371 @@
+"""
+Record Arrays: A Concise Educational Guide
+
+2tuples.py packs an employee record as packed = ("Alice", 25, "Engineer") and
+unpacks it with name, age, profession = packed. Millions of such tuples cost
+a tuple object, a list pointer and usually a separate str object per record.
+This script introduces RecordArray, which stores the same records by column:
+- A schema names each field and gives it a type (str, int64, float64, category)
+- Numbers go into array.array buffers, text into one UTF-8 buffer plus offsets,
+  and repeated strings into small integer codes
+- Row views that unpack and compare like tuples
+- Bulk column reads, and fast tuple iteration with zip()
+- Memory per record and unpacking throughput against a list of tuples
+"""
+
+import time
+import tracemalloc
+from array import array
+from itertools import accumulate
+
+# ---------------------------------------------------------------------
+# 1. Records as Tuples
+
+packed = ("Alice", 25, "Engineer")
+name, age, profession = packed
+print("Unpacked values:", name, age, profession)
+print()
+
+
+# ---------------------------------------------------------------------
+# 2. Column Types
+# Every column supports append(value), extend(values), get(i), values() (the
+# whole column at once), truncate(length) (to undo a failed append) and
+# nbytes().
+
+class _NumberColumn:
+    """int64 ('q') or float64 ('d') values in one array buffer."""
+
+    def __init__(self, typecode):
+        self.data = array(typecode)
+
+    def append(self, value):
+        self.data.append(value)
+
+    def extend(self, values):
+        self.data.extend(values)
+
+    def get(self, i):
+        return self.data[i]
+
+    def truncate(self, length):
+        del self.data[length:]
+
+    def values(self):
+        return array(self.data.typecode, self.data)  # one memcpy
+
+    def nbytes(self):
+        return self.data.itemsize * len(self.data)
+
+
+class _StrColumn:
+    """All strings UTF-8 encoded into one bytearray; offsets[i] is where string i starts."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.offsets = array("q", [0])
+
+    def append(self, value):
+        if not isinstance(value, str):
+            raise TypeError(f"expected str, got {type(value).__name__}")
+        self.buffer += value.encode()
+        self.offsets.append(len(self.buffer))
+
+    def extend(self, values):
+        encoded = list(map(str.encode, values))  # TypeError for anything but str
+        self.offsets.extend(accumulate(map(len, encoded), initial=len(self.buffer)))
+        del self.offsets[-len(encoded) - 1]  # accumulate repeats the current end offset
+        self.buffer += b"".join(encoded)
+
+    def get(self, i):
+        return self.buffer[self.offsets[i]:self.offsets[i + 1]].decode()
+
+    def truncate(self, length):
+        del self.buffer[self.offsets[length]:]
+        del self.offsets[length + 1:]
+
+    def values(self):
+        buffer, offsets = self.buffer, self.offsets
+        return [buffer[start:end].decode() for start, end in zip(offsets, offsets[1:])]
+
+    def nbytes(self):
+        return len(self.buffer) + self.offsets.itemsize * len(self.offsets)
+
+
+class _CategoryColumn:
+    """Few distinct strings (like professions): each one stored once, rows hold a 2-byte code."""
+
+    def __init__(self):
+        self.codes = array("H")
+        self.categories = []
+        self._code_of = {}
+
+    def _code(self, value):
+        code = self._code_of.get(value)
+        if code is None:
+            if len(self.categories) == 65_536:
+                raise ValueError("a category column holds at most 65,536 distinct values")
+            code = self._code_of[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    def append(self, value):
+        self.codes.append(self._code(value))
+
+    def extend(self, values):
+        self.codes.extend(map(self._code, values))
+
+    def get(self, i):
+        return self.categories[self.codes[i]]
+
+    def truncate(self, length):
+        del self.codes[length:]
+
+    def values(self):
+        return list(map(self.categories.__getitem__, self.codes))
+
+    def nbytes(self):
+        return self.codes.itemsize * len(self.codes)  # plus the category strings, stored once
+
+
+COLUMN_TYPES = {
+    "int64": lambda: _NumberColumn("q"),
+    "float64": lambda: _NumberColumn("d"),
+    "str": _StrColumn,
+    "category": _CategoryColumn,
+}
+
+
+# ---------------------------------------------------------------------
+# 3. RecordArray and Row Views
+# A Row is just (record array, index): it reads its fields from the columns
+# when asked, so creating one costs a small object and no copying.
+
+class Row:
+    """Lightweight view of one record; unpacks, indexes and compares like a tuple."""
+
+    __slots__ = ("_records", "_index")
+
+    def __init__(self, records, index):
+        self._records = records
+        self._index = index
+
+    def __iter__(self):
+        index = self._index
+        return (column.get(index) for column in self._records._columns)
+
+    def __len__(self):
+        return len(self._records._columns)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):  # a field name
+            return self._records._column(key).get(self._index)
+        return self._records._columns[key].get(self._index)
+
+    def astuple(self):
+        return tuple(self)
+
+    def __eq__(self, other):
+        if isinstance(other, (Row, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={value!r}" for field, value in zip(self._records.fields, self))
+        return f"Row({fields})"
+
+
+class RecordArray:
+    """Records with a fixed schema, stored column by column."""
+
+    def __init__(self, schema, records=()):
+        for field, kind in schema:
+            if kind not in COLUMN_TYPES:
+                raise ValueError(f"unknown type {kind!r} for field {field!r} (use one of {sorted(COLUMN_TYPES)})")
+        self.schema = list(schema)
+        self.fields = [field for field, _ in self.schema]
+        self._columns = [COLUMN_TYPES[kind]() for _, kind in self.schema]
+        self._positions = {field: i for i, field in enumerate(self.fields)}
+        self._len = 0
+        self.extend(records)
+
+    def _column(self, field):
+        try:
+            return self._columns[self._positions[field]]
+        except KeyError:
+            raise KeyError(f"no field named {field!r}") from None
+
+    def _check_width(self, record):
+        if len(record) != len(self._columns):
+            raise ValueError(f"record has {len(record)} fields, schema has {len(self._columns)}")
+
+    def _rollback(self):
+        """Cut every column back to the last complete record, so they stay aligned."""
+        for column in self._columns:
+            column.truncate(self._len)
+
+    def append(self, record):
+        self._check_width(record)
+        try:
+            for column, value in zip(self._columns, record):
+                column.append(value)
+        except Exception:
+            self._rollback()
+            raise
+        self._len += 1
+
+    def extend(self, records):
+        """Append many records, one column at a time (each column is filled in bulk)."""
+        records = list(records)
+        for record in records:
+            self._check_width(record)
+        if not records:
+            return
+        try:
+            for column, values in zip(self._columns, zip(*records)):
+                column.extend(values)
+        except Exception:
+            self._rollback()
+            raise
+        self._len += len(records)
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("RecordArray index out of range")
+        return Row(self, index)
+
+    def __iter__(self):
+        return map(Row, [self] * self._len, range(self._len))
+
+    def column(self, field):
+        """All values of one field: an array for numbers, a list for text."""
+        return self._column(field).values()
+
+    def itertuples(self):
+        """Plain tuples, built by zipping whole columns (much faster than Row views)."""
+        return zip(*(column.values() for column in self._columns))
+
+    def nbytes(self):
+        return sum(column.nbytes() for column in self._columns)
+
+    def __repr__(self):
+        return f"RecordArray({self.schema}, {self._len} records)"
+
+
+# ---------------------------------------------------------------------
+# 4. Using RecordArray
+
+EMPLOYEE = [("name", "str"), ("age", "int64"), ("profession", "category")]
+staff = RecordArray(EMPLOYEE, [packed, ("Bob", 31, "Designer"), ("Chloé", 42, "Engineer")])
+
+print("staff:", staff)
+name, age, profession = staff[0]  # unpacks like the tuple
+print("Unpacked row 0:", name, age, profession)
+print("Row 2:", staff[2])
+print("staff[1]['age']:", staff[1]["age"], "| staff[-1][0]:", staff[-1][0])
+print("Row 0 == packed?", staff[0] == packed)
+print("Ages column:", staff.column("age"))
+print("Professions column:", staff.column("profession"))
+print("Average age:", sum(staff.column("age")) / len(staff))
+for name, age, profession in staff:
+    print(f"  {name} ({age}) - {profession}")
+print()
+
+# Edge case: records must match the schema
+try:
+    staff.append(("Dan", 29))
+except ValueError as e:
+    print("ValueError:", e)
+
+# Edge case: a bad value rolls the whole record back, so columns stay aligned
+try:
+    staff.append(("Dan", "29", "Analyst"))
+except TypeError as e:
+    print("TypeError:", e, "| records:", len(staff), "| names:", staff.column("name"))
+
+# Edge case: unknown field names and types
+try:
+    staff.column("salary")
+except KeyError as e:
+    print("KeyError:", e)
+
+try:
+    RecordArray([("age", "int8")])
+except ValueError as e:
+    print("ValueError:", e)
+print()
+
+
+# ---------------------------------------------------------------------
+# 5. Benchmark: Memory per Record and Unpacking Throughput
+# Each record gets its own name string, as when records are read from a file.
+
+N = 200_000
+PROFESSIONS = ["Engineer", "Designer", "Manager", "Analyst", "Technician"]
+
+
+def make_records():
+    return [(f"Employee{i}", 20 + i % 45, PROFESSIONS[i % len(PROFESSIONS)]) for i in range(N)]
+
+
+def traced_bytes(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+tuples, tuple_bytes = traced_bytes(make_records)
+columns, column_bytes = traced_bytes(lambda: RecordArray(EMPLOYEE, tuples))
+
+print(f"Benchmark ({N:,} records):")
+print(f"  Memory per record - list of tuples: {tuple_bytes / N:6.1f} bytes | "
+      f"RecordArray: {column_bytes / N:6.1f} bytes (buffers: {columns.nbytes() / N:.1f})")
+
+
+def total_age(records):
+    total = 0
+    for name, age, profession in records:
+        total += age
+    return total
+
+
+runs = [
+    ("list of tuples", lambda: total_age(tuples)),
+    ("RecordArray rows", lambda: total_age(columns)),
+    ("RecordArray itertuples", lambda: total_age(columns.itertuples())),
+    ("RecordArray column('age')", lambda: sum(columns.column("age"))),
+]
+for label, run in runs:
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<26} {elapsed * 1000:8.1f} ms  ({N / elapsed / 1e6:6.2f} M records/s)  total age {result:,}")
+print()
+
+
+# ---------------------------------------------------------------------
+# 6. Summary and Key Takeaways
+
+summary = {
+    "packed": type(packed),
+    "staff": type(staff),
+    "staff[0]": type(staff[0]),
+    "ages": type(staff.column("age")),
+}
+
+print("Summary:")
+for var, typ in summary.items():
+    print(f"{var}: {typ.__name__}")
+print()
+print("Key takeaways:")
+print("- Storing records by column avoids one tuple (and often one str) object per record.")
+print("- Repeated strings become small integer codes; numbers become raw 8-byte values.")
+print("- Row views unpack like tuples but decode each field on access, so they are slower.")
+print("- For bulk work, read whole columns or zip() them into tuples.")
@@ -0,0 +1,342 @@
+"""
+Spatial Dictionaries: A Concise Educational Guide
+
+2tuples.py uses coordinate tuples as dictionary keys:
+    locations = {(10, 20): "Home"}
+Exact lookups are fast, but "what is nearest to (12, 19)?" or "what lies in
+this rectangle?" means checking every key. This script introduces
+SpatialDict, a dict keyed by (x, y) points that also keeps a grid hash:
+- Space is cut into square cells; each cell lists the points inside it
+- Exact get/set/delete/'in' work like a normal dict
+- k-nearest queries search outward cell ring by cell ring
+- Range (bounding box) queries only visit the cells the box touches
+- Bulk build (choosing a cell size from the data) and incremental inserts
+- A benchmark against scanning a plain dict
+"""
+
+import heapq
+import math
+import random
+import time
+
+# ---------------------------------------------------------------------
+# 1. Coordinate Keys in a Plain Dict
+
+locations = {(10, 20): "Home", (15, 22): "Office", (40, 5): "Gym"}
+print("locations[(10, 20)]:", locations[(10, 20)])
+target = (12, 19)
+closest = min(locations, key=lambda point: math.dist(point, target))  # scans every key
+print(f"Nearest to {target} by scanning:", locations[closest])
+print()
+
+
+# ---------------------------------------------------------------------
+# 2. The Grid Hash
+# A point (x, y) belongs to cell (floor(x / size), floor(y / size)). Points
+# in the same cell are close together, so a query only needs the cells near
+# it. A cell size around the typical spacing between points keeps cells
+# small but not mostly empty.
+#
+# Nearest neighbours: look at the query's own cell (ring 0), then the 8
+# cells around it (ring 1), and so on. Any point outside rings 0..r is more
+# than r * size away, so once the k-th best distance is no larger than that,
+# no further ring can improve the answer.
+#
+# Ring r has 8r cells, so far from the data most of them are empty. The
+# search starts at the first ring that reaches the occupied area, and once
+# the rings have cost more lookups than there are occupied cells it checks
+# the remaining occupied cells directly (as within() does for huge boxes).
+
+class SpatialDict:
+    """Dictionary with (x, y) keys that also answers nearest and range queries."""
+
+    def __init__(self, items=(), cell_size=None):
+        items = list(items.items() if isinstance(items, dict) else items)
+        self.cell_size = cell_size or self._choose_cell_size([point for point, _ in items])
+        self._data = {}
+        self._cells = {}
+        self._bounds = None  # [min cell x, min cell y, max cell x, max cell y] ever used
+        if items:
+            self._bulk_load(items)
+
+    def _bulk_load(self, items):
+        """Build from many items at once: bucket every point, then set the bounds once."""
+        self._data = dict(items)  # a repeated key keeps its last value, like dict()
+        size = self.cell_size
+        cells = self._cells
+        floor = math.floor
+        for point in self._data:
+            self._check_key(point)
+            cell = (floor(point[0] / size), floor(point[1] / size))
+            bucket = cells.get(cell)
+            if bucket is None:
+                cells[cell] = [point]
+            else:
+                bucket.append(point)
+        xs = [x for x, _ in cells]
+        ys = [y for _, y in cells]
+        self._bounds = [min(xs), min(ys), max(xs), max(ys)]
+
+    @staticmethod
+    def _choose_cell_size(points, points_per_cell=2):
+        if len(points) < 2:
+            return 1.0
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        area = (max(xs) - min(xs) or 1) * (max(ys) - min(ys) or 1)
+        return math.sqrt(area * points_per_cell / len(points))
+
+    def _cell(self, point):
+        size = self.cell_size
+        return math.floor(point[0] / size), math.floor(point[1] / size)
+
+    @staticmethod
+    def _check_key(point):
+        if not (isinstance(point, tuple) and len(point) == 2):
+            raise TypeError(f"keys must be (x, y) tuples, got {point!r}")
+
+    # Dict behaviour ---------------------------------------------------
+
+    def __setitem__(self, point, value):
+        self._check_key(point)
+        if point not in self._data:
+            cell = self._cell(point)
+            self._cells.setdefault(cell, []).append(point)
+            self._grow_bounds(cell)
+        self._data[point] = value
+
+    def _grow_bounds(self, cell):
+        x, y = cell
+        if self._bounds is None:
+            self._bounds = [x, y, x, y]
+            return
+        bounds = self._bounds
+        if x < bounds[0]:
+            bounds[0] = x
+        elif x > bounds[2]:
+            bounds[2] = x
+        if y < bounds[1]:
+            bounds[1] = y
+        elif y > bounds[3]:
+            bounds[3] = y
+
+    def __getitem__(self, point):
+        return self._data[point]
+
+    def get(self, point, default=None):
+        return self._data.get(point, default)
+
+    def __contains__(self, point):
+        return point in self._data
+
+    def __delitem__(self, point):
+        del self._data[point]  # KeyError if missing, like a dict
+        cell = self._cell(point)
+        bucket = self._cells[cell]
+        bucket.remove(point)
+        if not bucket:
+            del self._cells[cell]
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def items(self):
+        return self._data.items()
+
+    def __repr__(self):
+        return f"SpatialDict({self._data!r}, cell_size={self.cell_size:g})"
+
+    def rebuild(self, cell_size=None):
+        """Re-bucket every point, e.g. after many inserts have changed the density."""
+        self.__init__(list(self._data.items()), cell_size)
+
+    # Spatial queries --------------------------------------------------
+
+    def nearest(self, point, k=1):
+        """Up to k (distance, key, value) entries closest to point, nearest first."""
+        if k < 1 or not self._data:
+            return []
+        k = min(k, len(self._data))
+        cx, cy = self._cell(point)
+        cells = self._cells
+        # Furthest ring that can contain a point at all (beyond it every cell is empty).
+        # Bounds only grow, so after deletes they may be loose, which is still safe.
+        min_x, min_y, max_x, max_y = self._bounds
+        max_ring = max(cx - min_x, max_x - cx, cy - min_y, max_y - cy, 0)
+        first_ring = max(min_x - cx, cx - max_x, min_y - cy, cy - max_y, 0)  # rings before it are empty
+        best = []  # heap of (-distance, key) holding the k best so far
+        looked_up = 0
+        for ring in range(first_ring, max_ring + 1):
+            looked_up += 8 * ring
+            scan_rest = looked_up > len(cells)
+            if scan_rest:
+                ring_cells = [cell for cell in cells if max(abs(cell[0] - cx), abs(cell[1] - cy)) >= ring]
+            else:
+                ring_cells = self._ring_cells(cx, cy, ring)
+            for cell in ring_cells:
+                for candidate in cells.get(cell, ()):
+                    entry = (-math.dist(point, candidate), candidate)
+                    if len(best) < k:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+            if scan_rest or (len(best) == k and -best[0][0] <= ring * self.cell_size):
+                break
+        return [(-distance, key, self._data[key]) for distance, key in sorted(best, reverse=True)]
+
+    @staticmethod
+    def _ring_cells(cx, cy, ring):
+        if ring == 0:
+            return [(cx, cy)]
+        cells = [(cx + dx, cy + dy) for dx in range(-ring, ring + 1) for dy in (-ring, ring)]
+        cells += [(cx + dx, cy + dy) for dx in (-ring, ring) for dy in range(-ring + 1, ring)]
+        return cells
+
+    def within(self, xmin, ymin, xmax, ymax):
+        """(key, value) pairs with xmin <= x <= xmax and ymin <= y <= ymax."""
+        (cx0, cy0), (cx1, cy1) = self._cell((xmin, ymin)), self._cell((xmax, ymax))
+        cells = self._cells
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(cells):
+            # A huge box: walking the occupied cells is cheaper than every cell in the box.
+            buckets = [bucket for (x, y), bucket in cells.items() if cx0 <= x <= cx1 and cy0 <= y <= cy1]
+        else:
+            buckets = [cells[cell] for cell in
+                       ((x, y) for x in range(cx0, cx1 + 1) for y in range(cy0, cy1 + 1)) if cell in cells]
+        data = self._data
+        return [(point, data[point]) for bucket in buckets for point in bucket
+                if xmin <= point[0] <= xmax and ymin <= point[1] <= ymax]
+
+
+# ---------------------------------------------------------------------
+# 3. Using SpatialDict
+
+places = SpatialDict(locations, cell_size=10)
+places[(11, 18)] = "Cafe"  # incremental insert
+print("places:", places)
+print("places[(10, 20)]:", places[(10, 20)], "| (40, 5) in places?", (40, 5) in places)
+print(f"2 nearest to {target}:", [(round(d, 2), key, value) for d, key, value in places.nearest(target, k=2)])
+print("Inside the box (0, 0)-(20, 20):", places.within(0, 0, 20, 20))
+del places[(11, 18)]
+print("After deleting the cafe, nearest:", places.nearest(target)[0][2])
+print()
+
+# Edge case: asking for more neighbours than there are points returns them all
+print("k=10 on 3 points:", [value for _, _, value in places.nearest(target, k=10)])
+
+# Edge case: missing keys raise KeyError, like a dict
+try:
+    places[(0, 0)]
+except KeyError as e:
+    print("KeyError:", e)
+
+# Edge case: keys must be 2D points
+try:
+    places["Home"] = (10, 20)
+except TypeError as e:
+    print("TypeError:", e)
+
+# Edge case: negative and float coordinates land in the right cells
+mixed = SpatialDict({(-0.5, -0.5): "sw", (0.5, 0.5): "ne", (10.0, 20.0): "far"}, cell_size=1)
+print("Nearest to (-0.4, -0.6):", mixed.nearest((-0.4, -0.6))[0][2],
+      "| box (-1, -1)-(0, 0):", mixed.within(-1, -1, 0, 0))
+print()
+
+# Check against brute force on random data
+rng = random.Random(3)
+points = {(rng.uniform(-50, 50), rng.uniform(-50, 50)): i for i in range(1_000)}
+checked = SpatialDict(points)
+for _ in range(100):
+    spread = rng.choice([60, 60, 5_000])  # some queries far outside the points
+    query = (rng.uniform(-spread, spread), rng.uniform(-spread, spread))
+    expected = heapq.nsmallest(5, points, key=lambda p: math.dist(p, query))
+    assert [key for _, key, _ in checked.nearest(query, k=5)] == expected
+    x0, y0 = rng.uniform(-60, 40), rng.uniform(-60, 40)
+    box = (x0, y0, x0 + rng.uniform(0, 30), y0 + rng.uniform(0, 30))
+    assert sorted(checked.within(*box)) == sorted(
+        (p, v) for p, v in points.items() if box[0] <= p[0] <= box[2] and box[1] <= p[1] <= box[3])
+print("Matched brute force on 100 random nearest and range queries.")
+start = time.perf_counter()
+far = checked.nearest((60_000, 60_000))
+print(f"Query far outside the data: {(time.perf_counter() - start) * 1000:.2f} ms -> {far[0][1]}")
+print()
+
+
+# ---------------------------------------------------------------------
+# 4. Benchmark: Grid Hash vs Scanning the Dict
+# Scanning is slow, so it runs fewer queries; times are per query.
+
+N = 200_000
+SIDE = 10_000
+random.seed(11)
+plain = {(random.uniform(0, SIDE), random.uniform(0, SIDE)): f"place{i}" for i in range(N)}
+queries = [(random.uniform(0, SIDE), random.uniform(0, SIDE)) for _ in range(1_000)]
+
+print(f"Benchmark ({N:,} points):")
+start = time.perf_counter()
+spatial = SpatialDict(plain)
+print(f"  bulk build:            {(time.perf_counter() - start) * 1000:8.1f} ms (cell size {spatial.cell_size:.1f})")
+start = time.perf_counter()
+incremental = SpatialDict(cell_size=spatial.cell_size)
+for point, value in plain.items():
+    incremental[point] = value
+print(f"  incremental inserts:   {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+def per_query_ms(run, batch):
+    start = time.perf_counter()
+    results = [run(query) for query in batch]
+    return (time.perf_counter() - start) * 1000 / len(batch), results
+
+
+def scan_nearest(query):
+    return heapq.nsmallest(5, plain, key=lambda p: math.dist(p, query))
+
+
+def scan_box(query):
+    x, y = query
+    return [(p, v) for p, v in plain.items() if x <= p[0] <= x + 100 and y <= p[1] <= y + 100]
+
+
+few = queries[:10]
+scan_time, scan_results = per_query_ms(scan_nearest, few)
+grid_time, grid_results = per_query_ms(lambda q: spatial.nearest(q, k=5), queries)
+same = scan_results == [[key for _, key, _ in result] for result in grid_results[:len(few)]]
+print(f"  5-nearest, dict scan:  {scan_time:8.3f} ms/query | grid: {grid_time:8.3f} ms/query "
+      f"| {scan_time / grid_time:,.0f}x faster, same answers: {same}")
+
+scan_time, scan_results = per_query_ms(scan_box, few)
+grid_time, grid_results = per_query_ms(lambda q: spatial.within(q[0], q[1], q[0] + 100, q[1] + 100), queries)
+same = all(sorted(a) == sorted(b) for a, b in zip(scan_results, grid_results))
+print(f"  100x100 box, dict scan:{scan_time:8.3f} ms/query | grid: {grid_time:8.3f} ms/query "
+      f"| {scan_time / grid_time:,.0f}x faster, same answers: {same}")
+
+start = time.perf_counter()
+for query in queries:
+    spatial.get(query)
+print(f"  exact get (miss):      {(time.perf_counter() - start) * 1e6 / len(queries):8.3f} us/query (same as a dict)")
+print()
+
+
+# ---------------------------------------------------------------------
+# 5. Summary and Key Takeaways
+
+summary = {
+    "locations": type(locations),
+    "places": type(places),
+    "nearest result": type(places.nearest(target)),
+    "cell key": type(places._cell(target)),
+}
+
+print("Summary:")
+for var, typ in summary.items():
+    print(f"{var}: {typ.__name__}")
+print()
+print("Key takeaways:")
+print("- Dicts answer exact lookups in O(1) but need a full scan for 'near' or 'inside'.")
+print("- A grid hash groups nearby points into cells, keyed by (cell_x, cell_y).")
+print("- Nearest-neighbour search grows outward ring by ring and stops once nothing closer can exist.")
+print("- Range queries visit only the cells the box overlaps.")
+print("- Pick a cell size near the typical point spacing; rebuild if the density changes a lot.")
@@ -0,0 +1,258 @@
+"""
+Tuple Interning: A Concise Educational Guide
+
+2tuples.py builds tuples with t1 + t2, t1 * 3 and nesting like
+((1, 2), (3, 4)). Every one of those expressions creates a new tuple object,
+even when an equal tuple already exists. When the same small tuples appear
+millions of times, sharing one canonical object per value (hash-consing)
+saves a lot of memory. This script introduces TuplePool, an opt-in interning
+layer:
+- intern(t) returns one shared instance for equal tuples, including nested ones
+- Tuples no one else uses any more are dropped from the pool
+- Statistics: hit rate and bytes saved
+- A memory measurement on a duplicate-heavy dataset
+
+Note: CPython does not allow weak references to tuples (or to tuple
+subclasses), so the pool can't use weakref.WeakValueDictionary. Instead
+it periodically sweeps out tuples whose only references are the pool's own,
+found with sys.getrefcount (a CPython detail). The effect is the same: the
+pool never keeps an otherwise unused tuple alive for long.
+"""
+
+import math
+import sys
+import time
+import tracemalloc
+
+# ---------------------------------------------------------------------
+# 1. Equal Tuples Are Usually Separate Objects
+
+t1 = (1, 2)
+t2 = (3, 4)
+a = t1 + t2
+b = t1 + t2
+print("a == b:", a == b, "| a is b:", a is b)  # equal, but two objects
+print("Size of each:", sys.getsizeof(a), "bytes")
+print()
+
+
+# ---------------------------------------------------------------------
+# 2. The Pool
+# The pool is a dict mapping each canonical tuple to itself, so looking up
+# an equal tuple finds the shared one.
+#
+# Nested tuples are interned from the inside out: ((1, 2), (3, 4)) first
+# interns (1, 2) and (3, 4), so equal inner tuples are shared as well.
+#
+# dict lookups use ==, and 1 == 1.0 == True. A pool must not hand back (1,)
+# for (1.0,), so a found tuple is only used if every item has the same type
+# (and, for floats, the same sign of zero).
+#
+# The dict value is (canonical, size in bytes), so a hit can add up the
+# bytes saved without walking the tuple again.
+#
+# Sweeping: a pooled tuple is referenced twice by the pool (as the key and
+# inside its entry). If that is all, nobody else uses it and it is removed. Sweeps run
+# automatically whenever the pool has doubled since the last sweep.
+
+def _pool_refcounts(table):
+    return [(t, sys.getrefcount(t)) for t in table]
+
+
+def _calibrate():
+    probe = tuple([object()])
+    table = {probe: (probe, 0)}
+    del probe
+    return _pool_refcounts(table)[0][1]
+
+
+_POOL_ONLY = _calibrate()  # refcount seen by the sweep when only the pool holds a tuple
+
+
+def _same_items(x, y):
+    """True if equal tuples x and y also match in item types (checked all the way down)."""
+    for left, right in zip(x, y):
+        if left is right:
+            continue
+        if type(left) is not type(right):
+            return False
+        if type(left) is tuple and not _same_items(left, right):
+            return False
+        if type(left) is float and math.copysign(1, left) != math.copysign(1, right):
+            return False  # 0.0 == -0.0, but they are different values
+    return True
+
+
+def _tuple_bytes(value):
+    """Size of a tuple plus the tuples nested inside it (not counting other items)."""
+    return sys.getsizeof(value) + sum(_tuple_bytes(item) for item in value if type(item) is tuple)
+
+
+class TuplePool:
+    """Returns one canonical instance for equal hashable tuples."""
+
+    def __init__(self, min_sweep_size=1024):
+        self._table = {}
+        self._next_sweep = min_sweep_size
+        self.min_sweep_size = min_sweep_size
+        self.stats = {"hits": 0, "misses": 0, "not_interned": 0, "bytes_saved": 0, "swept": 0}
+
+    def intern(self, value):
+        if type(value) is not tuple:
+            return value  # leaves (and tuple subclasses) are returned unchanged
+        try:
+            entry = self._table.get(value)
+        except TypeError:  # contains something unhashable, e.g. a list
+            self.stats["not_interned"] += 1
+            return value
+        if entry is not None:
+            canonical, size = entry
+            if canonical is value:
+                self.stats["hits"] += 1
+                return value
+            if _same_items(canonical, value):
+                self.stats["hits"] += 1
+                self.stats["bytes_saved"] += size
+                return canonical  # its inner tuples are already canonical
+            self.stats["not_interned"] += 1  # equal but different types, e.g. (1,) and (1.0,)
+            return value
+        # A new value: make its inner tuples canonical first, then pool it.
+        if any(type(item) is tuple for item in value):
+            value = tuple(map(self.intern, value))
+        self.stats["misses"] += 1
+        self._table[value] = (value, _tuple_bytes(value))
+        if len(self._table) >= self._next_sweep:
+            self.sweep()
+        return value
+
+    def sweep(self):
+        """Drop tuples that only the pool still references; return how many were dropped."""
+        dropped = 0
+        while True:  # dropping an outer tuple can leave its inner tuples unused
+            unused = [t for t, refs in _pool_refcounts(self._table) if refs <= _POOL_ONLY]
+            if not unused:
+                break
+            for t in unused:
+                del self._table[t]
+            dropped += len(unused)
+            del unused
+        self.stats["swept"] += dropped
+        self._next_sweep = max(self.min_sweep_size, 2 * len(self._table))
+        return dropped
+
+    def hit_rate(self):
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+    def __len__(self):
+        return len(self._table)
+
+    def __contains__(self, value):
+        return value in self._table
+
+
+# ---------------------------------------------------------------------
+# 3. Using TuplePool
+
+pool = TuplePool()
+a = pool.intern(t1 + t2)
+b = pool.intern(t1 + t2)
+print("Interned: a == b:", a == b, "| a is b:", a is b)
+
+nested = pool.intern(((1, 2), (3, 4)))
+pair = pool.intern((1, 2))
+print("Nested tuple shares its inner tuple:", nested[0] is pair)
+repeated = pool.intern(t1 * 3)
+print("t1 * 3 interned:", repeated, "| again is same:", pool.intern(t1 * 3) is repeated)
+print("Stats:", pool.stats, f"| hit rate: {pool.hit_rate():.0%}")
+print()
+
+# Edge case: equal values of different types are kept apart
+print("(1,) vs (1.0,) vs (True,):", [pool.intern(t) for t in [(1,), (1.0,), (True,)]])
+print("(0.0,) vs (-0.0,):", pool.intern((0.0,)), pool.intern((-0.0,)))
+
+# Edge case: unhashable contents can't be interned; the tuple comes back as is
+mutable_inside = ([1, 2], [3, 4])
+print("Unhashable tuple returned unchanged:", pool.intern(mutable_inside) is mutable_inside)
+
+# Tuples nobody uses any more are swept out
+before = len(pool)
+del a, b, nested, pair, repeated
+print(f"Pool size {before} -> swept {pool.sweep()} unused -> {len(pool)} left")
+print()
+
+
+# ---------------------------------------------------------------------
+# 4. Memory on a Duplicate-Heavy Dataset
+# A log of 200,000 requests: (method, path) and (status, reason) repeat
+# constantly, as do the nested ((method, path), (status, reason)) keys.
+# Each row is parsed from text, so every row creates its own tuple objects.
+
+N = 200_000
+ROUTES = [f"GET /api/items/{i}" for i in range(200)] + [f"POST /api/orders/{i}" for i in range(50)]
+STATUSES = ["200 OK", "201 Created", "404 Not-Found", "500 Server-Error"]
+lines = [f"{ROUTES[(i * 7) % len(ROUTES)]} {STATUSES[i % 13 % len(STATUSES)]}" for i in range(N)]
+
+
+def parse(line, intern=None):
+    method, path, status, reason = line.split()
+    row = ((method, path), (int(status), reason))
+    return intern(row) if intern else row
+
+
+def load(intern=None):
+    return [parse(line, intern) for line in lines]
+
+
+def timed(build):
+    start = time.perf_counter()
+    build()
+    return time.perf_counter() - start
+
+
+def traced(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+# Time and memory are measured in separate runs: tracing slows the loads down a lot.
+plain_time = timed(load)
+pooled_time = timed(lambda: load(TuplePool().intern))
+rows, plain_bytes = traced(load)
+del rows
+big_pool = TuplePool()
+rows, pooled_bytes = traced(lambda: load(big_pool.intern))
+
+print(f"Duplicate-heavy dataset ({N:,} rows):")
+print(f"  plain tuples:    {plain_bytes / 1e6:7.1f} MB, {plain_time * 1000:7.1f} ms to load")
+print(f"  interned tuples: {pooled_bytes / 1e6:7.1f} MB, {pooled_time * 1000:7.1f} ms to load "
+      f"({1 - pooled_bytes / plain_bytes:.0%} less memory)")
+print(f"  distinct tuples in pool: {len(big_pool):,} | hit rate: {big_pool.hit_rate():.1%} | "
+      f"bytes saved (tuple objects): {big_pool.stats['bytes_saved'] / 1e6:.1f} MB")
+print("  A duplicate row is freed with the strings parsed for it; the pooled row keeps its own.")
+print()
+
+
+# ---------------------------------------------------------------------
+# 5. Summary and Key Takeaways
+
+summary = {
+    "t1": type(t1),
+    "pool": type(pool),
+    "stats": type(pool.stats),
+    "rows": type(rows),
+}
+
+print("Summary:")
+for var, typ in summary.items():
+    print(f"{var}: {typ.__name__}")
+print()
+print("Key takeaways:")
+print("- Equal tuples built at runtime are separate objects unless you share them.")
+print("- A dict mapping each tuple to itself finds the shared (canonical) instance.")
+print("- Intern nested tuples from the inside out so inner tuples are shared too.")
+print("- Check item types: 1, 1.0 and True are equal but are not the same value.")
+print("- Tuples can't be weakly referenced, so sweep out tuples only the pool still holds.")
@@ -0,0 +1,259 @@
+"""
+Streaming Deduplication: A Concise Educational Guide
+
+3sets.py removes duplicates with unique_elements = set(list_with_duplicates).
+That needs the whole input in memory and loses the original order. This
+script introduces unique(iterable), a streaming stage that yields each item
+the first time it appears, in input order:
+- Exact mode: remembers every distinct item in a set
+- Bounded mode: remembers items in a Bloom filter of fixed size, with a
+  configurable false-positive rate, so memory does not grow with the stream
+- Benchmarks across duplicate ratios (time, peak memory, items wrongly dropped)
+
+Run with a size argument (e.g. 100000000) to benchmark a longer stream.
+"""
+
+import math
+import random
+import sys
+import time
+import tracemalloc
+from itertools import islice, repeat
+from operator import mod
+
+# ---------------------------------------------------------------------
+# 1. set() Loses Order
+
+list_with_duplicates = [3, 1, 3, 2, 1, 3]
+print("set():", set(list_with_duplicates), "| first occurrences in order: [3, 1, 2]")
+print()
+
+
+# ---------------------------------------------------------------------
+# 2. Bloom Filters
+# A Bloom filter is a bit array plus k hash functions. Adding an item sets
+# its k bits; an item is "probably seen" if all its k bits are set. It never
+# misses an item that was added, but it can report an item as seen when its
+# bits were all set by other items: a false positive.
+#
+# For n items and a false-positive rate p, the best sizes are
+#   m = -n * ln(p) / ln(2)**2 bits    and    k = m / n * ln(2) hash functions
+# e.g. p = 1% costs about 9.6 bits (1.2 bytes) per item, whatever the items are.
+#
+# The k positions come from one hash(): it is scrambled into two 32-bit
+# halves h1, h2 and position i is h1 + i * h2 (double hashing).
+
+_MIX = 0x9E3779B97F4A7C15  # odd 64-bit constant; spreads hash(int), which is the int itself
+_MASK64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """Fixed-size probabilistic set: no false negatives, false positives at about error_rate."""
+
+    def __init__(self, capacity, error_rate=0.01):
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0  # items added that were not already (probably) present
+
+    def add(self, item):
+        """Add an item; return True if it was probably present already."""
+        h = hash(item) * _MIX & _MASK64
+        position, step = h >> 32, (h & 0xFFFFFFFF) | 1
+        bits, size = self._bits, self.size
+        present = True
+        for _ in range(self.hashes):
+            position %= size
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                present = False
+            position += step
+        if not present:
+            self.count += 1
+        return present
+
+    def __contains__(self, item):
+        h = hash(item) * _MIX & _MASK64
+        position, step = h >> 32, (h & 0xFFFFFFFF) | 1
+        bits, size = self._bits, self.size
+        for _ in range(self.hashes):
+            position %= size
+            if not bits[position >> 3] & 1 << (position & 7):
+                return False
+            position += step
+        return True
+
+    def estimated_error_rate(self):
+        """False-positive rate at the current fill: (fraction of bits set) ** k."""
+        filled = 1 - math.exp(-self.hashes * self.count / self.size)
+        return filled ** self.hashes
+
+    def nbytes(self):
+        return len(self._bits)
+
+    def __repr__(self):
+        return (f"BloomFilter(capacity={self.capacity:,}, error_rate={self.error_rate}, "
+                f"{self.nbytes():,} bytes, {self.hashes} hashes)")
+
+
+# ---------------------------------------------------------------------
+# 3. unique()
+# Items are read in chunks. dict.fromkeys(chunk) drops repeats inside the
+# chunk in C while keeping their order; only the remaining items are checked
+# against what earlier chunks produced. Memory is one chunk plus the seen set
+# (exact) or the fixed bit array (bloom).
+#
+# In bloom mode a false positive means a new item is dropped as a duplicate;
+# duplicates are never let through. Once more than `capacity` distinct items
+# have gone by, the filter fills up and the false-positive rate rises.
+
+def unique(iterable, bloom=None, chunk_size=4096):
+    """Yield the first occurrence of each item, in order.
+
+    With bloom=None every distinct item is kept in a set (exact). Pass a
+    BloomFilter to bound memory at the cost of its false-positive rate.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+    source = iter(iterable)
+    if bloom is None:
+        seen = set()
+        while chunk := list(islice(source, chunk_size)):
+            new = [item for item in dict.fromkeys(chunk) if item not in seen]
+            seen.update(new)
+            yield from new
+    else:
+        add = bloom.add
+        while chunk := list(islice(source, chunk_size)):
+            yield from [item for item in dict.fromkeys(chunk) if not add(item)]
+
+
+# ---------------------------------------------------------------------
+# 4. Using unique()
+
+print("unique(list_with_duplicates):", list(unique(list_with_duplicates)))
+words = "the cat and the hat and the bat".split()
+print("unique(words):", list(unique(words)))
+
+stream = unique(iter(range(10**12)))  # endless-looking input: nothing is read ahead of one chunk
+print("First 5 of a huge stream:", list(islice(stream, 5)))
+
+bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+print(bloom)
+print("Bloom mode:", list(unique([5, 7, 5, 9, 7, 5], bloom)), "| 9 in bloom?", 9 in bloom, "| 4 in bloom?", 4 in bloom)
+print()
+
+# Check against dict.fromkeys (which keeps first occurrences in order) on random data
+rng = random.Random(25)
+for trial in range(20):
+    data = [rng.randrange(rng.choice([5, 500, 50_000])) for _ in range(rng.randint(0, 20_000))]
+    assert list(unique(data, chunk_size=rng.choice([1, 7, 4096]))) == list(dict.fromkeys(data)), trial
+print("Matched dict.fromkeys on 20 random streams.")
+print()
+
+# Edge case: items must be hashable, as with set()
+try:
+    list(unique([[1], [1]]))
+except TypeError as e:
+    print("TypeError:", e)
+
+# Edge case: equal values count as duplicates, like in a set (1 == 1.0 == True)
+print("unique([1, 1.0, True, 2]):", list(unique([1, 1.0, True, 2])))
+
+# Edge case: invalid Bloom filter settings
+for capacity, error_rate in [(0, 0.01), (100, 1.5)]:
+    try:
+        BloomFilter(capacity, error_rate)
+    except ValueError as e:
+        print("ValueError:", e)
+
+# Edge case: overfilling a small filter raises its error rate
+tiny = BloomFilter(capacity=100, error_rate=0.01)
+kept = sum(1 for _ in unique(range(1_000), tiny))
+print(f"1,000 distinct items through a filter sized for 100: kept {kept:,}, "
+      f"estimated error rate now {tiny.estimated_error_rate():.0%}")
+print()
+
+
+# ---------------------------------------------------------------------
+# 5. Benchmark: Duplicate Ratios
+# A stream of N ints where a given fraction are repeats of earlier items,
+# generated lazily so the input itself takes no memory. The bloom filter is
+# sized for the number of distinct items at a 1% error rate. "dropped" counts
+# new items wrongly treated as duplicates.
+#
+# The default N is 200,000 so the script runs in seconds; at 100,000,000 the
+# exact set alone would need several GB, while the filter for 100M distinct
+# items at 1% is about 120 MB.
+#
+# Each Bloom check runs k hash positions in a Python loop, so bloom mode is
+# roughly ten times slower than the exact set. It trades speed for memory.
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+
+def make_stream(distinct):
+    return map(mod, range(N), repeat(distinct))  # 0..distinct-1, then repeats
+
+
+def consume(iterable):
+    count = 0
+    for count, _ in enumerate(iterable, 1):
+        pass
+    return count
+
+
+def traced_peak(run):
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+print(f"Benchmark ({N:,} items per stream):")
+for duplicate_ratio in [0.0, 0.5, 0.9, 0.99]:
+    distinct = max(1, int(N * (1 - duplicate_ratio)))
+    runs = [
+        ("set() (unordered)", lambda: len(set(make_stream(distinct)))),
+        ("unique() exact", lambda: consume(unique(make_stream(distinct)))),
+        ("unique() bloom 1%", lambda: consume(unique(make_stream(distinct), BloomFilter(distinct, 0.01)))),
+    ]
+    print(f"  {duplicate_ratio:.0%} duplicates ({distinct:,} distinct):")
+    for label, run in runs:
+        start = time.perf_counter()
+        kept = run()
+        elapsed = time.perf_counter() - start
+        peak = traced_peak(run)  # separate run: tracing slows Python down
+        print(f"    {label:<18} {elapsed * 1000:8.1f} ms ({N / elapsed / 1e6:5.2f} M items/s) | "
+              f"peak memory {peak / 1e6:7.2f} MB | dropped {distinct - kept:,}")
+print()
+
+
+# ---------------------------------------------------------------------
+# 6. Summary and Key Takeaways
+
+summary = {
+    "list_with_duplicates": type(list_with_duplicates),
+    "stream": type(stream),
+    "bloom": type(bloom),
+}
+
+print("Summary:")
+for var, typ in summary.items():
+    print(f"{var}: {typ.__name__}")
+print()
+print("Key takeaways:")
+print("- set() needs all the data at once and forgets the order; unique() streams in order.")
+print("- dict.fromkeys() removes repeats inside a chunk in C, keeping first occurrences.")
+print("- An exact seen-set grows with the number of distinct items.")
+print("- A Bloom filter uses a fixed ~1.2 bytes per expected item at a 1% error rate.")
+print("- Bloom false positives drop a few new items; duplicates never get through.")
+print("- Size the filter for the distinct count you expect, or the error rate climbs.")
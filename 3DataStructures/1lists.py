@@ -90,6 +90,7 @@ print("List with mixed types:", mixed_types)
 
 # Edge case: Removing items while iterating
 sample = [1, 2, 3, 4]
+# Note: remove() inside the loop makes this O(n^2); see 7removeWhere.py for a one-pass version.
 for item in sample[:]:  # Iterate over a copy to avoid issues
     if item % 2 == 0:
         sample.remove(item)
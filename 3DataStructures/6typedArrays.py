@@ -0,0 +1,203 @@
+"""
+Typed Arrays: A Concise Educational Guide
+
+This script introduces a typed, contiguous-buffer list built on the standard
+library's array module. It mirrors the list methods used in 1lists.py
+(append, insert, pop, count, extend, sort, 'in'), then compares memory per
+element and throughput against the builtin list.
+"""
+
+import sys
+import timeit
+from array import array
+
+# ---------------------------------------------------------------------
+# 1. Why Typed Arrays?
+# A builtin list stores pointers to boxed int objects (about 8 bytes for the
+# pointer plus ~28 bytes per int object). array.array stores raw machine
+# values in one contiguous buffer: 8 bytes per int64 or float64.
+
+boxed = [1, 2, 3]
+packed = array("q", [1, 2, 3])  # 'q' = signed 64-bit int, 'd' = 64-bit float
+print("Builtin list:", boxed)
+print("array('q'):", packed.tolist())
+print()
+
+
+# ---------------------------------------------------------------------
+# 2. A TypedList with the Same Method Surface as list
+# count, 'in', sort and extend each run as one C-level call over the buffer.
+# Without NumPy, CPython still creates a temporary int object for every element
+# it compares, so the big win is memory and bulk copies, not comparison speed.
+
+class TypedList:
+    """List-like container storing int64 or float64 values in one buffer."""
+
+    TYPECODES = {"int64": "q", "float64": "d"}
+
+    def __init__(self, values=(), dtype="int64"):
+        if dtype not in self.TYPECODES:
+            raise ValueError(f"Unsupported dtype: {dtype!r} (use 'int64' or 'float64')")
+        self.dtype = dtype
+        self._data = array(self.TYPECODES[dtype], values)
+
+    def append(self, value):
+        self._data.append(value)
+
+    def insert(self, index, value):
+        self._data.insert(index, value)
+
+    def pop(self, index=-1):
+        return self._data.pop(index)
+
+    def remove(self, value):
+        self._data.remove(value)
+
+    def count(self, value):
+        return self._data.count(value)
+
+    def extend(self, values):
+        # Extending from another typed buffer is a single memcpy.
+        if isinstance(values, TypedList):
+            values = values._data
+        self._data.extend(values)
+
+    def sort(self, reverse=False):
+        # sorted() unpacks the buffer into a temporary list; the result is packed back in one step.
+        self._data = array(self._data.typecode, sorted(self._data, reverse=reverse))
+
+    def tolist(self):
+        return self._data.tolist()
+
+    def __contains__(self, value):
+        return value in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            result = TypedList(dtype=self.dtype)
+            result._data = self._data[index]
+            return result
+        return self._data[index]
+
+    def __setitem__(self, index, value):
+        self._data[index] = value
+
+    def __delitem__(self, index):
+        del self._data[index]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __repr__(self):
+        return f"TypedList({self._data.tolist()}, dtype={self.dtype!r})"
+
+    def nbytes(self):
+        """Bytes used by the element buffer."""
+        return self._data.itemsize * len(self._data)
+
+
+# ---------------------------------------------------------------------
+# 3. The 1lists.py Workflow on a TypedList
+
+numbers = TypedList([1, 2, 3, 4, 5])
+print("numbers:", numbers)
+
+numbers[2] = 99
+numbers.append(6)
+numbers.insert(1, 42)
+removed = numbers.pop()
+del numbers[0]
+print("After modify/append/insert/pop/del:", numbers, "| Popped value:", removed)
+
+print("Is 42 in numbers?", 42 in numbers)
+print("Count of 99:", numbers.count(99))
+
+numbers.extend([7, 8])
+numbers.sort()
+print("After extend and sort:", numbers)
+
+prices = TypedList([2.5, 1.25, 3.0], dtype="float64")
+prices.sort(reverse=True)
+print("float64 prices sorted (desc):", prices)
+print()
+
+# Edge case: values must match the dtype
+try:
+    numbers.append("nine")
+except TypeError as e:
+    print("TypeError:", e)
+
+# Edge case: int64 overflow is rejected instead of silently wrapping
+try:
+    numbers.append(2 ** 63)
+except OverflowError as e:
+    print("OverflowError:", e)
+
+# Edge case: unknown dtype
+try:
+    TypedList(dtype="int8")
+except ValueError as e:
+    print("ValueError:", e)
+print()
+
+
+# ---------------------------------------------------------------------
+# 4. Benchmark: Memory per Element and Throughput
+# Sizes are kept small so the script runs quickly; raise N to test at scale.
+
+N = 1_000_000
+REPEAT = 3
+
+builtin_list = list(range(N))
+typed_list = TypedList(range(N))
+
+list_bytes = sys.getsizeof(builtin_list) + sum(sys.getsizeof(x) for x in builtin_list)
+typed_bytes = typed_list.nbytes()
+
+print(f"Benchmark (N = {N:,}):")
+print(f"  Memory per element - list: {list_bytes / N:.1f} bytes | TypedList: {typed_bytes / N:.1f} bytes")
+
+
+def best_time(stmt):
+    return min(timeit.repeat(stmt, number=1, repeat=REPEAT))
+
+
+operations = {
+    "count": (lambda: builtin_list.count(N - 1), lambda: typed_list.count(N - 1)),
+    "in (miss)": (lambda: -1 in builtin_list, lambda: -1 in typed_list),
+    "extend": (lambda: list(builtin_list).extend(builtin_list),
+               lambda: typed_list[:].extend(typed_list)),
+    "sort": (lambda: sorted(builtin_list, reverse=True),
+             lambda: typed_list[:].sort(reverse=True)),
+}
+
+for op_name, (list_op, typed_op) in operations.items():
+    list_time = best_time(list_op)
+    typed_time = best_time(typed_op)
+    print(f"  {op_name:<10} list: {list_time * 1000:8.2f} ms | TypedList: {typed_time * 1000:8.2f} ms")
+print()
+
+
+# ---------------------------------------------------------------------
+# 5. Summary and Key Takeaways
+
+summary = {
+    "boxed": type(boxed),
+    "packed": type(packed),
+    "numbers": type(numbers),
+    "prices": type(prices),
+}
+
+print("Summary:")
+for var, typ in summary.items():
+    print(f"{var}: {typ.__name__}")
+print()
+print("Key takeaways:")
+print("- array.array stores raw values contiguously, saving memory over boxed lists.")
+print("- A thin wrapper can keep the familiar list method names.")
+print("- extend between typed buffers is a bulk copy and much faster than for lists.")
+print("- count, 'in' and sort unbox each element, so without NumPy they are slower than list.")
+print("- Typed buffers reject values of the wrong type or out of range.")
@@ -0,0 +1,155 @@
+"""
+Removing Items In Place: A Concise Educational Guide
+
+1lists.py removes even numbers "safely" by iterating over a copy and calling
+remove() inside the loop. Each remove() searches and shifts the list, so the
+pattern is O(n^2). This script introduces remove_where(), a one-pass, in-place
+compaction that keeps order, and benchmarks it against the copy-and-remove loop.
+"""
+
+import timeit
+from array import array
+
+# ---------------------------------------------------------------------
+# 1. The Copy-and-Remove Pattern (from 1lists.py)
+# sample[:] copies the whole list, and every remove() scans from the front
+# and shifts all later items left by one.
+
+sample = [1, 2, 3, 4]
+for item in sample[:]:
+    if item % 2 == 0:
+        sample.remove(item)
+print("Copy-and-remove result:", sample)
+print()
+
+
+# ---------------------------------------------------------------------
+# 2. remove_where: One-Pass Compaction
+# Walk the sequence once, moving each kept item down to a write position.
+# Everything after the last write position is deleted in a single step.
+
+def remove_where(seq, predicate, chunk_size=None):
+    """Remove every item for which predicate(item) is true, in place.
+
+    Works on any mutable sequence supporting slice assignment and deletion
+    (list, array.array, bytearray). Order of the kept items is preserved.
+    With chunk_size set, items are filtered a chunk at a time: this runs the
+    predicate in a comprehension (faster) while extra memory stays bounded
+    by one chunk. Returns the number of removed items.
+
+    If predicate raises, the items checked so far are removed and the rest
+    of the sequence is left as it was, like a copy-and-remove loop.
+    """
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+    write = read = 0
+    length = len(seq)
+    try:
+        if chunk_size is None:
+            for read in range(length):
+                item = seq[read]
+                if not predicate(item):
+                    seq[write] = item
+                    write += 1
+        else:
+            for read in range(0, length, chunk_size):
+                kept = [item for item in seq[read:read + chunk_size] if not predicate(item)]
+                if isinstance(seq, array):
+                    kept = array(seq.typecode, kept)  # arrays only accept arrays in slice assignment
+                # The kept slice never grows past the chunk just read, so this overwrites in place.
+                seq[write:write + len(kept)] = kept
+                write += len(kept)
+        read = length
+    finally:
+        # seq[write:read] holds stale copies of items already moved or removed.
+        del seq[write:read]
+    return length - write
+
+
+sample = [1, 2, 3, 4]
+removed = remove_where(sample, lambda x: x % 2 == 0)
+print("remove_where result:", sample, "| Removed:", removed)
+
+# Typed buffers (array.array) are compacted in place the same way.
+typed = array("q", range(10))
+remove_where(typed, lambda x: x % 3 == 0, chunk_size=4)
+print("remove_where on array('q') (chunked):", typed.tolist())
+print()
+
+# Edge cases: empty input, nothing removed, everything removed
+empty = []
+print("Empty list, removed:", remove_where(empty, lambda x: True), "->", empty)
+
+odds = [1, 3, 5]
+print("Nothing to remove, removed:", remove_where(odds, lambda x: x % 2 == 0), "->", odds)
+
+evens = [2, 4, 6]
+print("Remove everything, removed:", remove_where(evens, lambda x: x % 2 == 0), "->", evens)
+
+try:
+    remove_where([1, 2], lambda x: True, chunk_size=0)
+except ValueError as e:
+    print("ValueError:", e)
+
+# Edge case: if the predicate raises, the list stays consistent (no duplicated items)
+for chunk_size in (None, 2):
+    partial = [1, 2, 3, 4, 5, 6]
+    try:
+        remove_where(partial, lambda x: 1 / (x - 4) and x % 2 == 0, chunk_size=chunk_size)
+    except ZeroDivisionError as e:
+        print(f"ZeroDivisionError (chunk_size={chunk_size}):", e, "->", partial)
+print()
+
+
+# ---------------------------------------------------------------------
+# 3. Benchmark: Copy-and-Remove vs remove_where
+# The quadratic loop is only timed at the smallest size; at a million items
+# it would run for minutes.
+
+SIZES = (10_000, 1_000_000, 10_000_000)
+LOOP_LIMIT = 10_000
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+def copy_and_remove(seq):
+    for item in seq[:]:
+        if is_even(item):
+            seq.remove(item)
+
+
+print("Benchmark (remove even numbers):")
+for size in SIZES:
+    timings = {}
+    if size <= LOOP_LIMIT:
+        data = list(range(size))
+        timings["copy+remove"] = timeit.timeit(lambda: copy_and_remove(data), number=1)
+    data = list(range(size))
+    timings["remove_where"] = timeit.timeit(lambda: remove_where(data, is_even), number=1)
+    data = list(range(size))
+    timings["chunked"] = timeit.timeit(lambda: remove_where(data, is_even, chunk_size=65_536), number=1)
+    line = " | ".join(f"{name}: {seconds * 1000:9.2f} ms" for name, seconds in timings.items())
+    print(f"  n = {size:>10,}  {line}")
+print()
+
+
+# ---------------------------------------------------------------------
+# 4. Summary and Key Takeaways
+
+summary = {
+    "sample": type(sample),
+    "typed": type(typed),
+    "removed": type(removed),
+}
+
+print("Summary:")
+for var, typ in summary.items():
+    print(f"{var}: {typ.__name__}")
+print()
+print("Key takeaways:")
+print("- Calling remove() inside a loop makes removal O(n^2).")
+print("- A read/write index compaction removes items in one O(n) pass.")
+print("- Deleting the tail once (del seq[write:]) avoids repeated shifting.")
+print("- Chunked filtering trades a small bounded buffer for extra speed.")
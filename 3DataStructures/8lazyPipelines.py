@@ -0,0 +1,200 @@
+"""
+Lazy Pipelines: A Concise Educational Guide
+
+Every comprehension in 5listComprehensions.py (squares, even_squares, cubes,
+filtered, int_numbers) builds a complete list in memory. This script introduces
+a small, composable Pipeline object (map/filter/flatten/collect) built on
+generators, so nothing is computed until the results are consumed, plus a
+chunked mode that processes items in fixed-size batches with bounded memory.
+"""
+
+import timeit
+import tracemalloc
+from itertools import chain, islice
+
+# ---------------------------------------------------------------------
+# 1. Generators Are Lazy
+# A generator expression produces items one at a time, on demand.
+
+numbers = [1, 2, 3, 4, 5]
+squares_list = [x ** 2 for x in numbers]   # computed now, stored in memory
+squares_gen = (x ** 2 for x in numbers)    # computed later, one at a time
+print("List comprehension:", squares_list)
+print("Generator expression:", squares_gen)
+print("Generator consumed:", list(squares_gen))
+print()
+
+
+# ---------------------------------------------------------------------
+# 2. A Composable Pipeline
+# Each method returns a new Pipeline with one more stage; the source is only
+# read when the pipeline is iterated or collected.
+
+class Pipeline:
+    """Lazy chain of map/filter/flatten stages over any iterable."""
+
+    def __init__(self, source, stages=(), chunk_size=None):
+        self.source = source
+        self.stages = tuple(stages)
+        self.chunk_size = chunk_size
+
+    def _then(self, kind, func=None):
+        return Pipeline(self.source, self.stages + ((kind, func),), self.chunk_size)
+
+    def map(self, func):
+        return self._then("map", func)
+
+    def filter(self, predicate):
+        return self._then("filter", predicate)
+
+    def flatten(self):
+        return self._then("flatten")
+
+    def chunked(self, chunk_size=65_536):
+        """Process items in batches of chunk_size instead of one at a time."""
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        return Pipeline(self.source, self.stages, chunk_size)
+
+    def __iter__(self):
+        if self.chunk_size is None:
+            return self._iter_items()
+        return self._iter_chunks()
+
+    def _iter_items(self):
+        items = iter(self.source)
+        for kind, func in self.stages:
+            if kind == "map":
+                items = map(func, items)
+            elif kind == "filter":
+                items = filter(func, items)
+            else:
+                items = chain.from_iterable(items)
+        return items
+
+    def _iter_chunks(self):
+        # Each chunk runs through every stage as a list comprehension. Memory
+        # stays bounded by one chunk, and each stage sees a whole batch at once.
+        source = iter(self.source)
+        while True:
+            chunk = list(islice(source, self.chunk_size))
+            if not chunk:
+                return
+            for kind, func in self.stages:
+                if kind == "map":
+                    chunk = [func(x) for x in chunk]
+                elif kind == "filter":
+                    chunk = [x for x in chunk if func(x)]
+                else:
+                    chunk = [y for x in chunk for y in x]
+            yield from chunk
+
+    def collect(self, into=list):
+        """Run the pipeline and gather the results (list by default)."""
+        return into(self)
+
+    def sum(self):
+        """Run the pipeline and add up the results without storing them."""
+        return sum(self)
+
+
+# ---------------------------------------------------------------------
+# 3. The 5listComprehensions.py Examples as Pipelines
+
+squares = Pipeline(numbers).map(lambda x: x ** 2).collect()
+even_squares = Pipeline(numbers).filter(lambda x: x % 2 == 0).map(lambda x: x ** 2).collect()
+cubes = Pipeline(range(1, 6)).map(lambda x: x ** 3).collect()
+flattened = Pipeline([[1, 2], [3, 4], [5, 6]]).flatten().collect()
+filtered = Pipeline([1, None, 2, None, 3]).filter(lambda x: x is not None).collect()
+int_numbers = Pipeline(['1', '2', 'three', '4']).filter(str.isdigit).map(int).collect()
+
+print("squares:", squares)
+print("even_squares:", even_squares)
+print("cubes:", cubes)
+print("flattened:", flattened)
+print("filtered:", filtered)
+print("int_numbers:", int_numbers)
+print("Collected into a set:", Pipeline([1, 1, 2]).collect(into=set))
+print()
+
+# Nothing runs until the pipeline is consumed.
+calls = []
+lazy = Pipeline(numbers).map(lambda x: calls.append(x) or x)
+print("Stage calls before iterating:", len(calls))
+first = next(iter(lazy))
+print("Stage calls after taking one item:", len(calls), "| first item:", first)
+
+# Pipelines are reusable when their source is (a list or range, not a generator).
+base = Pipeline(range(10)).filter(lambda x: x % 2 == 0)
+print("Reused with different maps:", base.map(str).collect(), base.map(lambda x: -x).collect())
+print()
+
+# Edge cases: empty source and invalid chunk size
+print("Empty source:", Pipeline([]).map(lambda x: x * 2).collect())
+try:
+    Pipeline(numbers).chunked(0)
+except ValueError as e:
+    print("ValueError:", e)
+print()
+
+
+# ---------------------------------------------------------------------
+# 4. Benchmark: Memory and Time for filter + map over Many Integers
+# Eager comprehensions hold every intermediate list; the pipeline streams.
+
+N = 2_000_000
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+def square(x):
+    return x * x
+
+
+def eager():
+    evens = [x for x in range(N) if is_even(x)]
+    return sum([square(x) for x in evens])
+
+
+def lazy_items():
+    return Pipeline(range(N)).filter(is_even).map(square).sum()
+
+
+def lazy_chunks():
+    return Pipeline(range(N)).filter(is_even).map(square).chunked().sum()
+
+
+print(f"Benchmark (filter + map + sum over {N:,} ints):")
+for label, run in [("eager lists", eager), ("lazy items", lazy_items), ("lazy chunks", lazy_chunks)]:
+    seconds = timeit.timeit(run, number=1)
+    # Memory is measured in a separate run because tracing slows Python down.
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<12} time: {seconds * 1000:8.1f} ms | peak memory: {peak / 1_000_000:8.2f} MB")
+print()
+
+
+# ---------------------------------------------------------------------
+# 5. Key Takeaways & Summary
+
+summary = {
+    "squares_list": type(squares_list),
+    "squares_gen": type(squares_gen),
+    "base": type(base),
+    "squares": type(squares),
+}
+
+print("Summary: Variable types in this script:")
+for name, typ in summary.items():
+    print(f"{name}: {typ.__name__}")
+
+print("\nKey Takeaways:")
+print("- Generators compute items on demand instead of building whole lists.")
+print("- Chaining map/filter/flatten stages keeps each step small and reusable.")
+print("- Chunked processing keeps memory bounded by one batch at a time.")
+print("- In pure Python, builtin map()/filter() are already fast; measure before chunking.")
+print("- Collect only at the end, and only if you really need a list.")
@@ -0,0 +1,202 @@
+"""
+Contiguous Matrices: A Concise Educational Guide
+
+5listComprehensions.py flattens a list of lists with
+[item for row in matrix for item in row], which builds a brand-new list every
+time. This script introduces a row-major Matrix backed by one typed buffer.
+Rows, columns and the flattened matrix are memoryview slices of that buffer,
+so none of them copy any data.
+"""
+
+import timeit
+from array import array
+
+# ---------------------------------------------------------------------
+# 1. memoryview: Looking at a Buffer Without Copying
+# Slicing a memoryview gives a new view onto the same memory.
+
+buffer = array("q", [1, 2, 3, 4, 5, 6])
+view = memoryview(buffer)
+middle = view[2:4]
+buffer[2] = 30
+print("Buffer:", buffer.tolist())
+print("View slice [2:4] sees the change:", middle.tolist())
+print("Every second item (strided view):", view[::2].tolist())
+print()
+
+
+# ---------------------------------------------------------------------
+# 2. A Row-Major Matrix
+# Item (i, j) lives at position i * cols + j in the buffer.
+# Row i is the slice [i * cols:(i + 1) * cols]; column j is the strided slice [j::cols].
+
+class Matrix:
+    """2D matrix stored row by row in a single int64 or float64 buffer."""
+
+    TYPECODES = {"int64": "q", "float64": "d"}
+
+    def __init__(self, rows, dtype="int64"):
+        if dtype not in self.TYPECODES:
+            raise ValueError(f"Unsupported dtype: {dtype!r} (use 'int64' or 'float64')")
+        rows = list(rows)
+        self.n_rows = len(rows)
+        self.n_cols = len(rows[0]) if rows else 0
+        self.dtype = dtype
+        self._data = array(self.TYPECODES[dtype])
+        for i, row in enumerate(rows):
+            if len(row) != self.n_cols:
+                raise ValueError(f"Row {i} has {len(row)} items, expected {self.n_cols}")
+            self._data.extend(row)
+        self._view = memoryview(self._data)
+
+    @classmethod
+    def zeros(cls, n_rows, n_cols, dtype="int64"):
+        matrix = cls([], dtype=dtype)
+        matrix.n_rows, matrix.n_cols = n_rows, n_cols
+        matrix._data = array(cls.TYPECODES[dtype], bytes(8 * n_rows * n_cols))
+        matrix._view = memoryview(matrix._data)
+        return matrix
+
+    @property
+    def shape(self):
+        return (self.n_rows, self.n_cols)
+
+    def _row_index(self, i):
+        """Row i with negative indices counted from the end, like a list."""
+        if not -self.n_rows <= i < self.n_rows:
+            raise IndexError(f"row index {i} out of range")
+        return i % self.n_rows
+
+    def _column_index(self, j):
+        """Column j with negative indices counted from the end, like a list."""
+        if not -self.n_cols <= j < self.n_cols:
+            raise IndexError(f"column index {j} out of range")
+        return j % self.n_cols
+
+    def _offset(self, position):
+        """Flat index of (i, j)."""
+        i, j = position
+        return self._row_index(i) * self.n_cols + self._column_index(j)
+
+    def __getitem__(self, position):
+        return self._view[self._offset(position)]
+
+    def __setitem__(self, position, value):
+        self._view[self._offset(position)] = value
+
+    def row(self, i):
+        """Row i as a zero-copy memoryview."""
+        start = self._row_index(i) * self.n_cols
+        return self._view[start:start + self.n_cols]
+
+    def column(self, j):
+        """Column j as a zero-copy strided memoryview."""
+        return self._view[self._column_index(j)::self.n_cols]
+
+    def rows(self):
+        for i in range(self.n_rows):
+            yield self.row(i)
+
+    def columns(self):
+        """Iterate over the transposed matrix, one column view at a time."""
+        for j in range(self.n_cols):
+            yield self.column(j)
+
+    def flatten(self):
+        """The whole matrix in row-major order, as a zero-copy view."""
+        return self._view
+
+    def tolist(self):
+        return [row.tolist() for row in self.rows()]
+
+    def __repr__(self):
+        return f"Matrix({self.tolist()}, dtype={self.dtype!r})"
+
+
+# ---------------------------------------------------------------------
+# 3. Using the Matrix with the 5listComprehensions.py Input
+
+matrix = Matrix([[1, 2], [3, 4], [5, 6]])
+print("matrix:", matrix, "| shape:", matrix.shape)
+print("Item (2, 1):", matrix[2, 1])
+print("Row 1:", matrix.row(1).tolist())
+print("Column 0:", matrix.column(0).tolist())
+print("Row -1 and column -1:", matrix.row(-1).tolist(), matrix.column(-1).tolist())
+print("Flattened:", matrix.flatten().tolist())
+print("Transposed:", [column.tolist() for column in matrix.columns()])
+
+# Views share memory with the matrix: writes show up everywhere.
+flat = matrix.flatten()
+matrix[0, 0] = 100
+print("Flattened view after matrix[0, 0] = 100:", flat.tolist())
+print()
+
+# Edge cases: ragged input and out-of-range rows or columns
+try:
+    Matrix([[1, 2], [3]])
+except ValueError as e:
+    print("ValueError:", e)
+
+for access in [lambda: matrix.row(3), lambda: matrix.row(-4), lambda: matrix.column(-3)]:
+    try:
+        access()
+    except IndexError as e:
+        print("IndexError:", e)
+
+# Items are bounds-checked per axis, so (0, 2) can't spill over into row 1
+print("matrix[0, -1]:", matrix[0, -1], "| matrix[-1, 0]:", matrix[-1, 0])
+try:
+    matrix[0, 2]
+except IndexError as e:
+    print("IndexError:", e)
+
+print("Empty matrix shape:", Matrix([]).shape)
+print()
+
+
+# ---------------------------------------------------------------------
+# 4. Benchmark: Flatten and Row Iteration
+# SIZE x SIZE int64 items; 10k x 10k needs 800 MB for the buffer alone,
+# so the default is smaller. Raise SIZE to test at scale.
+
+SIZE = 2_000
+
+nested = [list(range(i * SIZE, (i + 1) * SIZE)) for i in range(SIZE)]
+packed = Matrix.zeros(SIZE, SIZE)
+packed.flatten()[:] = array("q", range(SIZE * SIZE))
+
+print(f"Benchmark ({SIZE:,} x {SIZE:,}):")
+timings = {
+    "flatten (list comprehension)": lambda: [item for row in nested for item in row],
+    "flatten (Matrix view)": lambda: packed.flatten(),
+    "row sums (list of lists)": lambda: [sum(row) for row in nested],
+    "row sums (Matrix rows)": lambda: [sum(row) for row in packed.rows()],
+    "column sums (zip transpose)": lambda: [sum(column) for column in zip(*nested)],
+    "column sums (Matrix columns)": lambda: [sum(column) for column in packed.columns()],
+}
+for label, run in timings.items():
+    seconds = min(timeit.repeat(run, number=1, repeat=3))
+    print(f"  {label:<30} {seconds * 1000:10.3f} ms")
+print()
+
+
+# ---------------------------------------------------------------------
+# 5. Key Takeaways & Summary
+
+summary = {
+    "buffer": type(buffer),
+    "view": type(view),
+    "matrix": type(matrix),
+    "flat": type(flat),
+}
+
+print("Summary: Variable types in this script:")
+for name, typ in summary.items():
+    print(f"{name}: {typ.__name__}")
+
+print("\nKey Takeaways:")
+print("- One contiguous buffer stores a whole matrix with no per-row lists.")
+print("- memoryview slices expose rows, columns and the flat matrix without copying.")
+print("- Strided views ([j::cols]) give transposed iteration for free.")
+print("- Views share memory with the buffer, so writes are visible through every view.")
+print("- Reading items from a view still creates int objects, so per-item sums are not faster.")
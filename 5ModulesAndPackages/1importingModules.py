@@ -70,6 +70,7 @@ except ImportError:
 # - Use aliases for clarity.
 # - Import only what you need.
 # - Place imports at the top of your file.
+# - For expensive modules used only on some code paths, see 3lazyImports.py.
 
 # ---------------------------------------------------------------------
 # 8. Summary: Mapping Variable Names to Their Types
@@ -0,0 +1,237 @@
+"""
+lazyImports.py
+
+A concise, educational guide to lazy imports in Python.
+Covers: what an import costs, a lazy module proxy that imports on first
+attribute access, a lazy form of 'from module import a, b', when laziness
+pays off, and a startup benchmark in fresh interpreters.
+"""
+
+import subprocess
+import sys
+
+# ---------------------------------------------------------------------
+# 1. Imports Are Not Free
+# The first 'import random' runs random.py and everything it imports.
+# Later imports only look the module up in sys.modules.
+
+print("Is 'random' loaded yet?", "random" in sys.modules)  # Output: False
+print("Is 'sys' loaded yet?", "sys" in sys.modules)        # Output: True (loaded at startup)
+
+# ---------------------------------------------------------------------
+# 2. A Lazy Module Proxy
+# LazyModule remembers a module name and imports it the first time any
+# attribute is read. The builtin __import__ is used so the proxy itself
+# doesn't need to import importlib.
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            __import__(self._name)
+            self._module = sys.modules[self._name]
+        return self._module
+
+    def __getattr__(self, attribute):
+        # Only called for attributes not found on the proxy itself.
+        return getattr(self._load(), attribute)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+rnd = LazyModule("random")
+print("Proxy created:", rnd)
+print("Is 'random' loaded after creating the proxy?", "random" in sys.modules)  # Output: False
+
+print("rnd.randint(1, 10) =", rnd.randint(1, 10))  # first use triggers the import
+print("Proxy after first use:", rnd)
+print("Is 'random' loaded now?", "random" in sys.modules)  # Output: True
+
+print()
+
+# ---------------------------------------------------------------------
+# 3. A Lazy 'from module import a, b'
+# lazy_from returns one LazyName per requested name. A LazyName resolves
+# the real object on first use and then forwards calls, attributes and the
+# common operators to it, so functions and numbers both keep working.
+
+
+class LazyName:
+    """Stand-in for a name imported from a module, resolved on first use."""
+
+    def __init__(self, module, name):
+        self._lazy_module = module
+        self._lazy_name = name
+        self._lazy_value = None
+        self._lazy_resolved = False
+
+    def _resolve(self):
+        if not self._lazy_resolved:
+            self._lazy_value = getattr(self._lazy_module, self._lazy_name)
+            self._lazy_resolved = True
+        return self._lazy_value
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attribute):
+        return getattr(self._resolve(), attribute)
+
+    def __repr__(self):
+        return repr(self._resolve())
+
+    def __str__(self):
+        return str(self._resolve())
+
+    def __format__(self, spec):
+        return format(self._resolve(), spec)
+
+    def __hash__(self):
+        return hash(self._resolve())
+
+    def __bool__(self):
+        return bool(self._resolve())
+
+    def __float__(self):
+        return float(self._resolve())
+
+    def __int__(self):
+        return int(self._resolve())
+
+
+def _forward(operator_name):
+    def method(self, *args):
+        return getattr(self._resolve(), operator_name)(*args)
+    method.__name__ = operator_name
+    return method
+
+
+# Arithmetic and comparison operators are looked up on the class, not the
+# instance, so they have to be defined on LazyName explicitly.
+for _operator in ["add", "sub", "mul", "truediv", "floordiv", "mod", "pow",
+                  "radd", "rsub", "rmul", "rtruediv", "rfloordiv", "rmod", "rpow",
+                  "neg", "pos", "abs", "eq", "ne", "lt", "le", "gt", "ge"]:
+    setattr(LazyName, f"__{_operator}__", _forward(f"__{_operator}__"))
+
+
+def lazy_from(module_name, *names):
+    """Lazy equivalent of 'from module_name import name1, name2, ...'."""
+    module = LazyModule(module_name)
+    proxies = tuple(LazyName(module, name) for name in names)
+    return proxies[0] if len(proxies) == 1 else proxies
+
+
+median, mean = lazy_from("statistics", "median", "mean")
+print("Is 'statistics' loaded before use?", "statistics" in sys.modules)  # Output: False
+print("median([3, 1, 2]) =", median([3, 1, 2]))                            # Output: 2
+print("mean([1, 2, 3, 4]) =", mean([1, 2, 3, 4]))                          # Output: 2.5
+
+tau = lazy_from("math", "tau")
+print("tau / 2 =", tau / 2)  # Output: 3.141592653589793
+
+print()
+
+# ---------------------------------------------------------------------
+# 4. Edge Cases
+# A missing module only fails when the proxy is first used, not when it is
+# created. A wrong name fails on first use too.
+
+missing = LazyModule("mymodule")
+print("Created proxy for a missing module:", missing)
+try:
+    missing.anything
+except ImportError as e:
+    print("ImportError on first use:", e)
+
+wrong = lazy_from("math", "not_a_function")
+try:
+    wrong(1)
+except AttributeError as e:
+    print("AttributeError on first use:", e)
+
+# Lazy proxies are not the real objects: isinstance() and 'is' checks see the proxy.
+print("isinstance(tau, float):", isinstance(tau, float))  # Output: False
+
+print()
+
+# ---------------------------------------------------------------------
+# 5. Startup Benchmark
+# Each case runs in a fresh interpreter and times only its import section.
+# (tools/profileImports.py gives a per-module breakdown.)
+# Laziness only helps when a module might not be used at all.
+
+RUNS = 15
+eager_code = "import random, datetime, statistics"
+lazy_code = (
+    "import sys\n"
+    "class LazyModule:\n"
+    "    def __init__(self, name): self._name = name\n"
+    "    def __getattr__(self, attr):\n"
+    "        __import__(self._name); return getattr(sys.modules[self._name], attr)\n"
+    "random, datetime, statistics = (LazyModule(n) for n in ('random', 'datetime', 'statistics'))\n"
+)
+cases = {
+    "empty interpreter": "pass",
+    "eager imports": eager_code,
+    "lazy, never used": lazy_code,
+    "lazy, all used": lazy_code + "random.random(); datetime.date; statistics.mean",
+}
+
+
+def best_startup(code):
+    timings = []
+    for _ in range(RUNS):
+        completed = subprocess.run(
+            [sys.executable, "-c", f"import time; s = time.perf_counter()\n{code}\n"
+                                   "print(time.perf_counter() - s)"],
+            capture_output=True, text=True,
+        )
+        timings.append(float(completed.stdout))
+    return min(timings)
+
+
+print(f"Startup benchmark (best of {RUNS} fresh interpreters, import section only):")
+for label, code in cases.items():
+    print(f"  {label:<20} {best_startup(code) * 1000:7.3f} ms")
+
+print()
+
+# ---------------------------------------------------------------------
+# 6. Best Practices
+# - Import eagerly at the top of the file by default; it is clearer.
+# - Consider lazy imports for expensive modules used only on some code paths.
+# - Modules loaded at startup (sys, os) gain nothing from laziness.
+# - Errors in a lazy import surface later, at first use.
+# - 'from module import *' has no lazy form: the names must exist up front.
+
+# ---------------------------------------------------------------------
+# 7. Summary: Mapping Variable Names to Their Types
+
+summary = {
+    "rnd": type(rnd),
+    "median": type(median),
+    "tau": type(tau),
+    "missing": type(missing),
+}
+
+print("Summary: Variable names and their types")
+for name, typ in summary.items():
+    print(f"{name}: {typ}")
+
+# ---------------------------------------------------------------------
+# Key Takeaways
+# - The first import of a module runs its code; that costs startup time.
+# - A proxy with __getattr__ can defer the import until first use.
+# - Lazy 'from' imports need proxies that forward calls and operators.
+# - Laziness pays off only when the module may never be used.
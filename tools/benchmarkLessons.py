@@ -0,0 +1,285 @@
+"""
+benchmarkLessons.py
+
+Runs every lesson script under 1Basics through 6ErrorHandling in its own Python
+process and records:
+- wall time (best of --repeat runs, measured around the script itself)
+- peak memory allocated by Python code (tracemalloc, in a separate traced run)
+- output volume (stdout bytes and lines)
+- exit status (ok, expected failure, or failed)
+
+Results are written as JSON and compared against a stored baseline, and the
+command exits with status 1 if any lesson regressed.
+
+Usage (from the repository root):
+    python tools/benchmarkLessons.py                     # run and compare
+    python tools/benchmarkLessons.py --output results.json
+    python tools/benchmarkLessons.py --only 3DataStructures
+    python tools/benchmarkLessons.py --update-baseline   # accept current numbers
+"""
+
+import argparse
+import json
+import os
+import re
+import runpy
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# ---------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "lessonBaseline.json"
+LESSON_DIRS = [
+    "1Basics",
+    "2ControlFlow",
+    "3DataStructures",
+    "4Functions",
+    "5ModulesAndPackages",
+    "6ErrorHandling",
+]
+
+# Lines fed to lessons that call input(), one per prompt.
+STDIN_FIXTURES = {
+    "1Basics/2inputOutput.py": "\n".join([
+        "hello",                  # Enter something
+        "7",                      # Enter a number
+        "",                       # Press Enter without typing
+        "   padded text   ",      # Enter text with spaces
+        "not a float",            # Enter a floating-point number (retried)
+        "3.5",
+    ]) + "\n",
+}
+
+# Lessons that end with an uncaught exception on purpose. 3finally.py shows
+# 'finally' without 'except' (FileNotFoundError) and an exception raised from
+# 'finally' (ValueError); the first one stops the script.
+EXPECTED_FAILURES = {
+    "6ErrorHandling/3finally.py": ("FileNotFoundError", "ValueError"),
+}
+
+# A lesson regresses when a metric grows by more than the relative tolerance
+# AND by more than the absolute floor (so tiny timings don't flap).
+TIME_TOLERANCE = 0.25
+TIME_FLOOR_SECONDS = 0.05
+MEMORY_TOLERANCE = 0.25
+MEMORY_FLOOR_BYTES = 256 * 1024
+OUTPUT_TOLERANCE = 0.10
+OUTPUT_FLOOR_BYTES = 512
+
+
+# ---------------------------------------------------------------------
+# Child Process: Run One Lesson
+# ---------------------------------------------------------------------
+
+def run_child(script, report_path, trace_memory):
+    """Execute a lesson as __main__ and write timing/exception info as JSON."""
+    lesson_dir = str(Path(script).resolve().parent)
+    sys.path.insert(0, lesson_dir)  # what `python lesson.py` would do
+    sys.argv = [script]
+
+    if trace_memory:
+        tracemalloc.start()
+    exception = None
+    start = time.perf_counter()
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            exception = f"SystemExit({e.code!r})"
+    except BaseException as e:  # report any failure to the parent
+        exception = type(e).__name__
+    wall_time = time.perf_counter() - start
+    peak = None
+    # A lesson that stops tracemalloc itself (e.g. for its own benchmark) cannot be measured.
+    if trace_memory and tracemalloc.is_tracing():
+        peak = tracemalloc.get_traced_memory()[1]
+
+    sys.stdout.flush()
+    with open(report_path, "w") as report:
+        json.dump({"wall_time": wall_time, "peak_memory": peak, "exception": exception}, report)
+
+
+# ---------------------------------------------------------------------
+# Parent Process: Discover, Run and Measure
+# ---------------------------------------------------------------------
+
+def lesson_number(script):
+    """Numeric prefix of a lesson file name (3finally.py -> 3)."""
+    match = re.match(r"\d+", script.name)
+    return int(match.group()) if match else 0
+
+
+def discover_lessons(only=None):
+    """Return lesson paths relative to the repo root, in curriculum order."""
+    lessons = []
+    for folder in LESSON_DIRS:
+        # Sort by the numeric prefix so 10x.py comes after 9x.py.
+        for script in sorted((REPO_ROOT / folder).glob("*.py"), key=lambda p: (lesson_number(p), p.name)):
+            relative = script.relative_to(REPO_ROOT).as_posix()
+            if only is None or any(relative.startswith(prefix) for prefix in only):
+                lessons.append(relative)
+    return lessons
+
+
+def run_lesson(lesson, trace_memory, timeout):
+    """Run one lesson in a fresh interpreter; return its report and stdout."""
+    report_path = REPO_ROOT / f".bench-{os.getpid()}.json"
+    command = [sys.executable, str(Path(__file__).resolve()), "--child", lesson, str(report_path)]
+    if trace_memory:
+        command.append("--trace-memory")
+    try:
+        completed = subprocess.run(
+            command,
+            cwd=REPO_ROOT,
+            input=STDIN_FIXTURES.get(lesson, "").encode(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=timeout,
+        )
+        with open(report_path) as report:
+            result = json.load(report)
+    except subprocess.TimeoutExpired:
+        return {"wall_time": None, "peak_memory": None, "exception": "Timeout"}, b""
+    except (OSError, ValueError):
+        return {"wall_time": None, "peak_memory": None, "exception": "RunnerError"}, b""
+    finally:
+        if report_path.exists():
+            report_path.unlink()
+    return result, completed.stdout
+
+
+def measure(lesson, repeat, timeout):
+    """Collect all metrics for one lesson."""
+    times = []
+    stdout = b""
+    exception = None
+    for _ in range(repeat):
+        report, stdout = run_lesson(lesson, trace_memory=False, timeout=timeout)
+        exception = report["exception"]
+        if report["wall_time"] is None:
+            break
+        times.append(report["wall_time"])
+
+    peak_memory = None
+    if times:
+        traced, _ = run_lesson(lesson, trace_memory=True, timeout=timeout)
+        peak_memory = traced["peak_memory"]
+
+    if exception is None:
+        status = "ok"
+    elif exception in EXPECTED_FAILURES.get(lesson, ()):
+        status = "expected-failure"
+    else:
+        status = "failed"
+
+    return {
+        "status": status,
+        "exception": exception,
+        "wall_time": min(times) if times else None,
+        "peak_memory": peak_memory,
+        "output_bytes": len(stdout),
+        "output_lines": stdout.count(b"\n"),
+    }
+
+
+# ---------------------------------------------------------------------
+# Baseline Comparison
+# ---------------------------------------------------------------------
+
+def grew(current, previous, tolerance, floor):
+    return current - previous > max(previous * tolerance, floor)
+
+
+def compare(results, baseline):
+    """Return a list of human-readable regression messages."""
+    problems = []
+    for lesson, result in results.items():
+        if result["status"] == "failed":
+            problems.append(f"{lesson}: failed with {result['exception']}")
+            continue
+        previous = baseline.get(lesson)
+        if previous is None:
+            continue
+        if previous["status"] != result["status"]:
+            problems.append(f"{lesson}: status changed {previous['status']} -> {result['status']}")
+        checks = [
+            ("wall_time", TIME_TOLERANCE, TIME_FLOOR_SECONDS, "{:.3f}s"),
+            ("peak_memory", MEMORY_TOLERANCE, MEMORY_FLOOR_BYTES, "{:,} B"),
+            ("output_bytes", OUTPUT_TOLERANCE, OUTPUT_FLOOR_BYTES, "{:,} B"),
+        ]
+        for metric, tolerance, floor, fmt in checks:
+            now, before = result[metric], previous.get(metric)
+            if now is None or before is None:
+                continue
+            if grew(now, before, tolerance, floor):
+                problems.append(f"{lesson}: {metric} {fmt.format(before)} -> {fmt.format(now)}")
+    return problems
+
+
+# ---------------------------------------------------------------------
+# Command Line
+# ---------------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every lesson script.")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--only", nargs="+", help="only run lessons whose path starts with one of these prefixes")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per lesson (best is kept)")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds before a lesson is killed")
+    parser.add_argument("--child", nargs=2, metavar=("SCRIPT", "REPORT"), help=argparse.SUPPRESS)
+    parser.add_argument("--trace-memory", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(*args.child, trace_memory=args.trace_memory)
+        return 0
+
+    results = {}
+    for lesson in discover_lessons(args.only):
+        result = measure(lesson, max(args.repeat, 1), args.timeout)
+        results[lesson] = result
+        wall = "-" if result["wall_time"] is None else f"{result['wall_time']:.3f}s"
+        peak = "-" if result["peak_memory"] is None else f"{result['peak_memory'] / 1024:,.0f} KiB"
+        print(f"{lesson:<45} {result['status']:<17} {wall:>9} {peak:>14} {result['output_bytes']:>8,} B")
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+        print(f"\nResults written to {args.output}")
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as existing:
+                baseline = json.load(existing)
+        baseline.update(results)
+        with open(args.baseline, "w") as output:
+            json.dump(baseline, output, indent=2, sort_keys=True)
+            output.write("\n")
+        print(f"\nBaseline updated: {args.baseline}")
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as stored:
+            baseline = json.load(stored)
+    problems = compare(results, baseline)
+    if problems:
+        print("\nREGRESSIONS DETECTED:", file=sys.stderr)
+        for problem in problems:
+            print(f"  - {problem}", file=sys.stderr)
+        return 1
+    print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+bufferedOutput.py
+
+A shared, large-buffer output sink for the print-heavy lesson scripts.
+
+Every print() on a terminal is line-buffered, so each line becomes its own
+write() system call. The sink replaces sys.stdout with a text stream over a
+1 MiB buffer. It flushes when the buffer fills, at exit, and before a
+traceback is printed. A discard mode sends everything to os.devnull for
+benchmarking.
+
+The sink only helps line-buffered terminal output. When stdout is a pipe or
+a file, Python already buffers it, and --measure shows the default path
+making the same single write() as the sink for these lessons.
+
+The ordering guarantee holds only while sys.stdout is the sink. If a script
+replaces sys.stdout itself, anything written to the replacement bypasses the
+sink and can come out before the sink's buffered text; run_script() then
+prints a warning to stderr.
+
+Switching a lesson to the sink is one line, with no changes to the lesson:
+    python tools/bufferedOutput.py 1Basics/3operators.py
+    python tools/bufferedOutput.py --discard 3DataStructures/4dictionaries.py
+
+Measuring write() calls and wall time with and without the sink:
+    python tools/bufferedOutput.py --measure 1Basics/3operators.py 1Basics/1dataTypes.py
+"""
+
+import argparse
+import atexit
+import io
+import json
+import os
+import runpy
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from benchmarkLessons import REPO_ROOT, STDIN_FIXTURES
+
+# ---------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------
+
+DEFAULT_BUFFER_SIZE = 1 << 20  # 1 MiB
+PYTHON_BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE  # 8 KiB, what Python uses for pipes
+
+
+# ---------------------------------------------------------------------
+# The Sink
+# ---------------------------------------------------------------------
+
+class CountingWriter(io.RawIOBase):
+    """Raw file-descriptor writer that counts write() system calls."""
+
+    def __init__(self, fd):
+        self._fd = fd
+        self.write_calls = 0
+
+    def writable(self):
+        return True
+
+    def fileno(self):
+        return self._fd
+
+    def write(self, data):
+        self.write_calls += 1
+        return os.write(self._fd, data)
+
+
+def install(buffer_size=DEFAULT_BUFFER_SIZE, discard=False, line_buffering=False):
+    """Replace sys.stdout with a buffered sink and return its raw writer.
+
+    The sink is flushed at exit and before any uncaught exception's traceback,
+    so output written before a crash still appears, and in the right order.
+    """
+    sys.stdout.flush()
+    if discard:
+        fd = os.open(os.devnull, os.O_WRONLY)
+    else:
+        fd = os.dup(sys.stdout.fileno())
+    raw = CountingWriter(fd)
+    sys.stdout = io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size),
+        encoding=sys.stdout.encoding,
+        errors=sys.stdout.errors,
+        line_buffering=line_buffering,
+        write_through=False,
+    )
+    atexit.register(sys.stdout.flush)  # the sink's own flush, even if sys.stdout is replaced later
+
+    previous_hook = sys.excepthook
+
+    sink = sys.stdout
+
+    def flush_then_report(exc_type, exc_value, traceback):
+        sink.flush()
+        previous_hook(exc_type, exc_value, traceback)
+
+    sys.excepthook = flush_then_report
+    return raw
+
+
+def run_script(script, **sink_options):
+    """Run a lesson as __main__ with the sink installed; return the raw writer."""
+    raw = install(**sink_options)
+    sink = sys.stdout
+    sys.path.insert(0, str(Path(script).resolve().parent))
+    sys.argv = [script]
+    try:
+        runpy.run_path(script, run_name="__main__")
+    finally:
+        sink.flush()  # flush-on-exception: output comes out before the traceback
+        if sys.stdout is not sink:
+            sys.stderr.write(f"bufferedOutput: {script} replaced sys.stdout; output written "
+                             "to the replacement bypassed the sink and may be out of order\n")
+    return raw
+
+
+# ---------------------------------------------------------------------
+# Measuring: write() Calls and Wall Time
+# ---------------------------------------------------------------------
+# Each configuration runs the lesson in a fresh interpreter with output
+# discarded, so only the cost of producing the writes is compared.
+
+CONFIGURATIONS = {
+    "terminal (line-buffered)": {"buffer_size": PYTHON_BUFFER_SIZE, "line_buffering": True},
+    "pipe (8 KiB buffer)": {"buffer_size": PYTHON_BUFFER_SIZE},
+    "sink (1 MiB buffer)": {"buffer_size": DEFAULT_BUFFER_SIZE},
+}
+
+
+def measure_child(script, configuration):
+    """Child process: run one configuration and report stats on stderr."""
+    options = dict(CONFIGURATIONS[configuration], discard=True)
+    start = time.perf_counter()
+    raw = None
+    try:
+        raw = run_script(script, **options)
+    except BaseException:  # lessons like 3finally.py end with an exception on purpose
+        raw = sys.stdout.buffer.raw
+    elapsed = time.perf_counter() - start
+    sys.stderr.write(json.dumps({"write_calls": raw.write_calls, "wall_time": elapsed}) + "\n")
+
+
+def measure(scripts, repeat):
+    for script in scripts:
+        lesson = Path(script).resolve().relative_to(REPO_ROOT).as_posix()
+        print(lesson)
+        for configuration in CONFIGURATIONS:
+            best = None
+            for _ in range(repeat):
+                completed = subprocess.run(
+                    [sys.executable, __file__, "--child", configuration, lesson],
+                    cwd=REPO_ROOT,
+                    input=STDIN_FIXTURES.get(lesson, ""),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+                stats = json.loads(completed.stderr.strip().splitlines()[-1])
+                if best is None or stats["wall_time"] < best["wall_time"]:
+                    best = stats
+            print(f"  {configuration:<26} write() calls: {best['write_calls']:>6} | "
+                  f"wall time: {best['wall_time'] * 1000:8.3f} ms")
+        print()
+
+
+# ---------------------------------------------------------------------
+# Command Line
+# ---------------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run lessons through a large-buffer output sink.")
+    parser.add_argument("scripts", nargs="+", help="lesson script(s) to run")
+    parser.add_argument("--discard", action="store_true", help="send output to os.devnull")
+    parser.add_argument("--buffer-size", type=int, default=DEFAULT_BUFFER_SIZE, help="sink buffer size in bytes")
+    parser.add_argument("--measure", action="store_true", help="compare write() calls and time with/without the sink")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per configuration when measuring (best is kept)")
+    parser.add_argument("--child", metavar="CONFIGURATION", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        measure_child(args.scripts[0], args.child)
+    elif args.measure:
+        measure(args.scripts, max(args.repeat, 1))
+    else:
+        if len(args.scripts) != 1:
+            parser.error("run one script at a time (or use --measure)")
+        run_script(args.scripts[0], buffer_size=args.buffer_size, discard=args.discard)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""
+profileImports.py
+
+Import-time profiler for the lesson scripts.
+
+For each lesson, every import statement it contains (in source order) is
+replayed in a fresh interpreter started with `python -X importtime`. The raw
+importtime lines are parsed into a dependency tree, repeated runs are
+aggregated (median), and a report ranks which of the lesson's imports
+dominate its startup time. Imports already loaded by the interpreter itself
+(sys, os, ...) cost nothing and show up as 0.
+
+Usage (from the repository root):
+    python tools/profileImports.py 5ModulesAndPackages/1importingModules.py
+    python tools/profileImports.py --runs 20 --tree 5ModulesAndPackages
+    python tools/profileImports.py --json imports.json 1Basics 5ModulesAndPackages
+"""
+
+import argparse
+import ast
+import json
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# ---------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MARKER = "--- lesson imports start ---"
+
+
+# ---------------------------------------------------------------------
+# Collecting a Lesson's Import Statements
+# ---------------------------------------------------------------------
+
+def import_statements(script):
+    """Return the source of every import statement in a script, in order."""
+    source = Path(script).read_text()
+    tree = ast.parse(source)
+    nodes = [node for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))]
+    nodes.sort(key=lambda node: (node.lineno, node.col_offset))
+    return [ast.get_source_segment(source, node) for node in nodes]
+
+
+def replay_program(statements):
+    """Build a -c program that prints a marker, then runs each import.
+
+    Each import is wrapped in try/except so a deliberately missing module
+    (like 'mymodule' in 1importingModules.py) doesn't stop the profile.
+    """
+    lines = ["import sys", f"sys.stderr.write({MARKER!r} + '\\n')"]
+    for statement in statements:
+        lines.append("try:")
+        lines.append(f"    {statement}")
+        lines.append("except ImportError:")
+        lines.append("    pass")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------
+# Parsing -X importtime Output into a Tree
+# ---------------------------------------------------------------------
+
+def parse_importtime(stderr):
+    """Turn importtime lines after the marker into a list of root nodes.
+
+    CPython prints a module after all the modules it imported, indented two
+    spaces per nesting level, so children always appear before their parent.
+    """
+    lines = stderr.splitlines()
+    if MARKER in lines:
+        lines = lines[lines.index(MARKER) + 1:]
+
+    pending = {}  # depth -> nodes waiting for their parent
+    for line in lines:
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        self_us, cumulative_us, name_field = int(fields[0]), int(fields[1]), fields[2][1:]
+        depth = (len(name_field) - len(name_field.lstrip(" "))) // 2
+        node = {
+            "module": name_field.strip(),
+            "self_us": self_us,
+            "cumulative_us": cumulative_us,
+            "children": pending.pop(depth + 1, []),
+        }
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def profile_once(statements):
+    """Run the import statements once in a fresh interpreter; return the tree."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", replay_program(statements)],
+        cwd=REPO_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+# ---------------------------------------------------------------------
+# Aggregating Repeated Runs
+# ---------------------------------------------------------------------
+
+def merge_runs(runs):
+    """Merge trees from several runs into one tree of median timings.
+
+    Nodes are matched by their module path from the root, so the same module
+    imported under the same parent is combined across runs.
+    """
+    samples = {}
+    order = []
+
+    def visit(node, path):
+        key = path + (node["module"],)
+        if key not in samples:
+            samples[key] = {"self_us": [], "cumulative_us": []}
+            order.append(key)
+        samples[key]["self_us"].append(node["self_us"])
+        samples[key]["cumulative_us"].append(node["cumulative_us"])
+        for child in node["children"]:
+            visit(child, key)
+
+    for roots in runs:
+        for root in roots:
+            visit(root, ())
+
+    nodes = {}
+    roots = []
+    for key in order:
+        node = {
+            "module": key[-1],
+            "self_us": statistics.median(samples[key]["self_us"]),
+            "cumulative_us": statistics.median(samples[key]["cumulative_us"]),
+            "runs_seen": len(samples[key]["self_us"]),
+            "children": [],
+        }
+        nodes[key] = node
+        if len(key) == 1:
+            roots.append(node)
+        else:
+            nodes[key[:-1]]["children"].append(node)
+    return roots
+
+
+def profile_lesson(script, runs):
+    """Profile one lesson; return its import statements and merged tree."""
+    statements = import_statements(script)
+    trees = [profile_once(statements) for _ in range(runs)]
+    return {"imports": statements, "tree": merge_runs(trees)}
+
+
+# ---------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------
+
+def print_tree(nodes, indent="    "):
+    for node in sorted(nodes, key=lambda n: n["cumulative_us"], reverse=True):
+        print(f"{indent}{node['module']:<{40 - len(indent)}} "
+              f"self {node['self_us']:>8.0f} us | cumulative {node['cumulative_us']:>8.0f} us")
+        print_tree(node["children"], indent + "  ")
+
+
+def print_report(lesson, profile, show_tree):
+    roots = profile["tree"]
+    total = sum(node["cumulative_us"] for node in roots)
+    print(f"{lesson}  ({len(profile['imports'])} import statements, {total / 1000:.2f} ms total)")
+    if not profile["imports"]:
+        print("    no import statements")
+    elif not roots:
+        print("    all imports were already loaded at interpreter startup")
+    for rank, node in enumerate(sorted(roots, key=lambda n: n["cumulative_us"], reverse=True), start=1):
+        share = node["cumulative_us"] / total * 100 if total else 0
+        print(f"  {rank:>2}. {node['module']:<30} {node['cumulative_us'] / 1000:8.3f} ms  {share:5.1f}%"
+              f"  ({len(node['children'])} direct dependencies)")
+    if show_tree and roots:
+        print("  Dependency tree:")
+        print_tree(roots)
+    print()
+
+
+def lesson_number(script):
+    """Numeric prefix of a lesson file name (3finally.py -> 3)."""
+    match = re.match(r"\d+", script.name)
+    return int(match.group()) if match else 0
+
+
+def discover(targets):
+    """Expand folders into their .py lessons; keep files as they are."""
+    scripts = []
+    for target in targets:
+        path = REPO_ROOT / target
+        if path.is_dir():
+            scripts.extend(sorted(path.glob("*.py"), key=lambda p: (lesson_number(p), p.name)))
+        else:
+            scripts.append(path)
+    return scripts
+
+
+# ---------------------------------------------------------------------
+# Command Line
+# ---------------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile import time of lesson scripts.")
+    parser.add_argument("targets", nargs="*", default=["5ModulesAndPackages"],
+                        help="lesson files or folders (relative to the repo root)")
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per lesson (median is reported)")
+    parser.add_argument("--tree", action="store_true", help="print the full dependency tree")
+    parser.add_argument("--json", help="write the structured results to this file")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for script in discover(args.targets):
+        if not script.exists():
+            print(f"{script}: not found", file=sys.stderr)
+            return 1
+        lesson = script.relative_to(REPO_ROOT).as_posix()
+        results[lesson] = profile_lesson(script, max(args.runs, 1))
+        print_report(lesson, results[lesson], args.tree)
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+        print(f"Results written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())